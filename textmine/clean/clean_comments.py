@@ -1,19 +1,109 @@
+import csv
 import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from argparse import ArgumentParser
-from nltk.stem import PorterStemmer
-from nltk.stem import WordNetLemmatizer
-from spellchecker import SpellChecker
-import re
 
-import textmine.utils.constants as constants
 import textmine.utils.custom_list_utils as list_utils
-from unidecode import unidecode
-from nltk.corpus import stopwords as sw
+from textmine.utils import corpus_store
+from textmine.clean.pipeline import CleaningPipeline
+from textmine.clean.spell_cache import SpellCorrectionCache
+from textmine.clean.stopwords import load_stopwords
 
 
 def load_yt_comments(filename):
-    comments = list_utils.read(filename)
-    return list_utils.flatten(comments)
+    return list(list_utils.iter_comments(filename))
+
+
+class _CleanedWriter:
+    """Writes cleaned comments as CSV, or as a corpus file that keeps each comment's metadata."""
+
+    def __init__(self, filename, corpus, stage):
+        self._corpus = corpus
+        self._stage = stage
+        if corpus:
+            self._writer = corpus_store.CorpusWriter(filename)
+        else:
+            self._file = open(filename, "w")
+            self._writer = csv.writer(self._file)
+
+    def write(self, records, cleaned):
+        if not self._corpus:
+            self._writer.writerows([comment] for comment in cleaned)
+            return
+        for record, comment in zip(records, cleaned):
+            # The stage column accumulates the codes of every cleaning pass
+            self._writer.write(comment, record["id"], record["source"], record["timestamp"],
+                               (record["stage"] or "") + self._stage)
+
+    def close(self):
+        if self._corpus:
+            self._writer.close()
+        else:
+            self._file.close()
+
+
+# Pipeline recompiled once per worker process by _init_worker
+_worker_pipeline = None
+
+
+def _init_worker(pipeline):
+    global _worker_pipeline
+    _worker_pipeline = pipeline
+
+
+def _clean_chunk(chunk):
+    cleaned = _worker_pipeline.transform_batch(chunk)
+    return cleaned, _worker_pipeline.spell_cache.drain()
+
+
+def _clean_files_parallel(jobs, pipeline, chunk_size, workers):
+    """Clean (input, output, corpus output) jobs on a process pool.
+
+    Chunks from every file are fanned out to the workers, which load the
+    pipeline once each. Results are collected in submission order, so
+    every output file is identical to the serial result. At most
+    ``2 * workers`` chunks are in flight to keep memory bounded. Workers start
+    from the saved spell correction cache, and the corrections they compute are
+    merged back into the pipeline's cache.
+    """
+    def tagged_chunks():
+        for index, (file, _, _) in enumerate(jobs):
+            for chunk in list_utils.chunked(list_utils.iter_comment_records(file), chunk_size):
+                yield index, chunk
+
+    writers = [None] * len(jobs)
+    pending = deque()
+
+    def open_writer(index):
+        if writers[index] is None:
+            _, output, corpus = jobs[index]
+            writers[index] = _CleanedWriter(output, corpus, pipeline.code)
+        return writers[index]
+
+    def write_next():
+        index, records, future = pending.popleft()
+        cleaned, (corrections, hits, misses) = future.result()
+        open_writer(index).write(records, cleaned)
+        pipeline.spell_cache.merge(corrections, hits, misses)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pipeline,)) as executor:
+            for index, records in tagged_chunks():
+                texts = [record["text"] for record in records]
+                pending.append((index, records, executor.submit(_clean_chunk, texts)))
+                if len(pending) >= 2 * workers:
+                    write_next()
+            while pending:
+                write_next()
+
+        # Inputs without comments still get an (empty) output file
+        for index in range(len(jobs)):
+            open_writer(index)
+    finally:
+        for writer in writers:
+            if writer is not None:
+                writer.close()
 
 
 def clean_comments(input_filename=None,
@@ -28,9 +118,38 @@ def clean_comments(input_filename=None,
                    remove_stopwords=False,
                    stem=False,
                    lemmatize=False,
-                   custom_stopwords_=None):
+                   custom_stopwords_=None,
+                   chunk_size=10000,
+                   workers=1,
+                   spell_cache_path=None,
+                   spell_cache_size=100000,
+                   pipeline=None,
+                   output_format=None):
+    """Clean comment CSV files.
 
+    Comments are streamed from each file in chunks of ``chunk_size``. Every
+    comment goes through all enabled stages in one pass, and each chunk is
+    written before the next one is read, so memory use does not grow with the
+    file size. With ``workers`` > 1, chunks from all files are cleaned on a
+    process pool and written back in their original order.
 
+    Spell corrections are memoized per token for all files, keeping up to
+    ``spell_cache_size`` tokens. If ``spell_cache_path`` is given, the cache
+    is loaded from it first and saved back to it afterwards.
+
+    ``custom_stopwords_`` is a string of comma-separated stop words or an
+    iterable of stop words. The NLTK English list is used if it is empty.
+    Tokens are matched whole and case-insensitively.
+
+    A compiled ``pipeline`` can be passed to reuse its loaded resources across
+    calls. In that case the stage flags, stop words and spell cache arguments
+    are ignored.
+
+    Inputs may be CSV or columnar corpus files (see ``textmine.utils.corpus_store``).
+    ``output_format`` is "csv" or "corpus". If it is None, each output uses its input's
+    format. Corpus outputs keep each comment's ID, source and timestamp, and
+    append the stage letter code to its stage column.
+    """
     if not input_filename and not input_directory:
         raise ValueError("Either input_filename or input_directory must be provided.")
 
@@ -40,96 +159,61 @@ def clean_comments(input_filename=None,
         all_files = os.listdir(input_directory)
         files = [os.path.join(input_directory, file) for file in all_files]
 
-    for file in files:
-        process_string = ""
-        yt_comments = load_yt_comments(file)
-
-        # Convert all characters to ASCII
-        if convert_to_ascii:
-            process_string += "a"
-            yt_comments = [unidecode(comment) for comment in yt_comments]
-
-        # Remove line breaks
-        if remove_line_breaks:
-            process_string += "b"
-            yt_comments = [comment
-                              .replace("\n", " ")
-                              .replace("\r", " ")
-                              .replace("\r\n", " ")
-                              for comment in yt_comments]
-
-        # Remove punctuation
-        if remove_punctuation:
-            print("Removing punctuation")
-            process_string += "p"
-            for i, comment in enumerate(yt_comments):
-                yt_comments[i] = "".join(str(ch) for ch in comment if ch not in constants.PUNCTUATION)
-
-        # Convert to lowercase
-        if lower:
-            print("Lower")
-            process_string += "l"
-            yt_comments = [comment.lower() for comment in yt_comments]
-
-        # Remove numbers
-        if remove_numbers:
-            print("Removing numbers")
-
-            process_string += "n"
-            yt_comments = [re.sub(r"[0-9]", "", comment) for comment in yt_comments]
-
-        # Spell check
-        if spell_check:
-            print("Spell check")
-
-            process_string += "s"
-            spell = SpellChecker()
-            for i, comment in enumerate(yt_comments):
-                comment = comment.split(" ")
-                new_comment = [spell.correction(word) for word in comment]
-                comment = [orig if corr is None else corr for (corr, orig) in zip(new_comment, comment)]
-                yt_comments[i] = " ".join(comment)
-
-        # Remove stopwords, either custom or according to nltk toolkit stopwords
-        if remove_stopwords:
-            print("Removing stop words")
-            process_string += "w"
-            if not custom_stopwords_:
-                custom_stopwords_ = sw.words("english")
-            for i, comment in enumerate(yt_comments):
-                comment = comment.split(" ")
-                comment = [word for word in comment if word.lower() not in custom_stopwords_]
-                yt_comments[i] = " ".join(comment)
-
-        # Stem words
-        if stem:
-            print("Stemming")
-            process_string += "S"
-            stemmer = PorterStemmer()
-            for i, comment in enumerate(yt_comments):
-                comment = comment.split(" ")
-                comment = [stemmer.stem(word) for word in comment]
-                yt_comments[i] = " ".join(comment)
-
-        # Lemmatize words
-        if lemmatize:
-            print("lemming")
-            process_string += "L"
-            lemmer = WordNetLemmatizer()
-            for i, comment in enumerate(yt_comments):
-                comment = comment.split(" ")
-                comment = [lemmer.lemmatize(word) for word in comment]
-                yt_comments[i] = " ".join(comment)
-
-        if len(process_string) > 0:
-            process_string += "_"
-            full_file_path = os.path.join(save_loc, process_string + os.path.split(file)[1])
-            yt_comments = list_utils.single_to_multi(yt_comments)
-            list_utils.write(yt_comments, full_file_path)
-        else:
+    if pipeline is None:
+        # Stop words, the spell checker and the stemmer are loaded once here
+        # and reused for every file
+        if not any((convert_to_ascii, remove_line_breaks, remove_punctuation, lower, remove_numbers, spell_check,
+                    remove_stopwords, stem, lemmatize)):
             print("none")
-            continue
+            return
+        pipeline = CleaningPipeline(convert_to_ascii,
+                                    remove_line_breaks,
+                                    remove_punctuation,
+                                    lower,
+                                    remove_numbers,
+                                    spell_check,
+                                    remove_stopwords,
+                                    stem,
+                                    lemmatize,
+                                    custom_stopwords_,
+                                    SpellCorrectionCache(spell_cache_size, spell_cache_path),
+                                    verbose=True)
+
+    process_string = pipeline.code
+    if len(process_string) == 0:
+        print("none")
+        return
+
+    if output_format not in (None, "csv", "corpus"):
+        raise ValueError(f"Unsupported output format '{output_format}'. Expected 'csv' or 'corpus'.")
+
+    process_string += "_"
+    jobs = []
+    for file in files:
+        name = os.path.split(file)[1]
+        input_corpus = corpus_store.is_corpus(file)
+        corpus = input_corpus if output_format is None else output_format == "corpus"
+        if corpus != input_corpus:
+            name = os.path.splitext(name)[0] + (corpus_store.CORPUS_EXTENSION if corpus else ".csv")
+        jobs.append((file, os.path.join(save_loc, process_string + name), corpus))
+
+    if workers > 1:
+        _clean_files_parallel(jobs, pipeline, chunk_size, workers)
+    else:
+        for file, full_file_path, corpus in jobs:
+            writer = _CleanedWriter(full_file_path, corpus, pipeline.code)
+            try:
+                for records in list_utils.chunked(list_utils.iter_comment_records(file), chunk_size):
+                    writer.write(records, pipeline.transform_batch([record["text"] for record in records]))
+            finally:
+                writer.close()
 
+    spell_cache = pipeline.spell_cache
+    if pipeline.options["spell_check"]:
+        print(f"Spell check cache: {spell_cache.hits} hits, {spell_cache.misses} misses "
+              f"({spell_cache.hit_rate:.1%} hit rate)")
+        if spell_cache.path:
+            spell_cache.save()
 
 if __name__ == "__main__":
     parser = ArgumentParser(prog="Clean Text",
@@ -185,6 +269,29 @@ if __name__ == "__main__":
     parser.add_argument("--custom_stop_words", "-W",
                         help="A string of comma-separated stop words. If --stop_words_file_path (-f) is passed, "
                              "a file path may be passed to this argument.")
+    parser.add_argument("--chunk_size", "-k",
+                        type=int,
+                        default=10000,
+                        help="Number of comments read, cleaned and written at a time. Defaults to 10000.")
+    parser.add_argument("--workers", "-j",
+                        type=int,
+                        default=1,
+                        help="Number of worker processes. Chunks of every file are cleaned in parallel and written "
+                             "in their original order. Defaults to 1.")
+    parser.add_argument("--spell_cache", "-C",
+                        help="A JSON file of memoized spell check corrections. It is loaded before cleaning if it "
+                             "exists and saved afterwards, so later runs reuse earlier corrections.")
+    parser.add_argument("--spell_cache_size",
+                        type=int,
+                        default=100000,
+                        help="Maximum number of words kept in the spell check cache. Defaults to 100000.")
+    parser.add_argument("--stage_code",
+                        help="Enable stages by their letter code instead of by individual flags, e.g. 'apblnswSL'. "
+                             "The stage flags are ignored if this is passed.")
+    parser.add_argument("--output_format", "-O",
+                        choices=("csv", "corpus"),
+                        help="Write cleaned comments as CSV or as a columnar corpus file that keeps comment IDs, "
+                             "sources and timestamps. Defaults to the format of each input file.")
     parser.add_argument("--stop_words_file_path", "-f",
                         action="store_true",
                         help="A file was passed to --custom_stop_words (-W). Ignored in --custom_stop_words (-W) is "
@@ -198,8 +305,18 @@ if __name__ == "__main__":
     custom_stopwords = args.custom_stop_words
     if custom_stopwords is not None:
         if args.stop_words_file_path:
-            with open(custom_stopwords, "r") as f:
-                custom_stopwords = f.read()
+            custom_stopwords = load_stopwords(stopwords_file=custom_stopwords)
+
+    pipeline = None
+    if args.stage_code:
+        try:
+            pipeline = CleaningPipeline.from_code(args.stage_code,
+                                                  custom_stopwords=custom_stopwords,
+                                                  spell_cache=SpellCorrectionCache(args.spell_cache_size,
+                                                                                   args.spell_cache),
+                                                  verbose=True)
+        except ValueError as e:
+            parser.error(str(e))
 
     clean_comments(args.input_file,
                    args.input_dir,
@@ -213,4 +330,10 @@ if __name__ == "__main__":
                    args.remove_stopwords,
                    args.stem,
                    args.lemmatize,
-                   custom_stopwords)
+                   custom_stopwords,
+                   args.chunk_size,
+                   args.workers,
+                   args.spell_cache,
+                   args.spell_cache_size,
+                   pipeline,
+                   args.output_format)
@@ -0,0 +1,56 @@
+from unidecode import unidecode
+
+import textmine.utils.constants as constants
+
+
+def build_translation_table(remove_line_breaks=False, remove_punctuation=False, remove_numbers=False):
+    """Build one ``str.translate`` table covering every enabled character-level removal.
+
+    Line breaks map to a space, punctuation from ``constants.PUNCTUATION`` and
+    the ASCII digits are deleted.
+    """
+    table = {}
+    if remove_line_breaks:
+        table[ord("\n")] = " "
+        table[ord("\r")] = " "
+    if remove_punctuation:
+        table.update(dict.fromkeys(map(ord, constants.PUNCTUATION)))
+    if remove_numbers:
+        table.update(dict.fromkeys(range(ord("0"), ord("9") + 1)))
+    return table
+
+
+def build_normalizer(convert_to_ascii=False,
+                     remove_line_breaks=False,
+                     remove_punctuation=False,
+                     lower=False,
+                     remove_numbers=False):
+    """Compile the character-level cleaning stages into a single function.
+
+    Line break, punctuation and number removal become one C-level
+    ``str.translate`` pass. Lowercasing runs after it. That gives the same
+    result as the original stage order (line breaks, punctuation, lower,
+    numbers), because lowercasing never creates or removes punctuation or
+    digits. ASCII conversion runs first, since it can introduce punctuation
+    and digits.
+
+    Returns None if no character-level stage is enabled.
+    """
+    table = build_translation_table(remove_line_breaks, remove_punctuation, remove_numbers)
+
+    if convert_to_ascii:
+        if table and lower:
+            return lambda comment: unidecode(comment).translate(table).lower()
+        elif table:
+            return lambda comment: unidecode(comment).translate(table)
+        elif lower:
+            return lambda comment: unidecode(comment).lower()
+        return unidecode
+
+    if table and lower:
+        return lambda comment: comment.translate(table).lower()
+    elif table:
+        return lambda comment: comment.translate(table)
+    elif lower:
+        return str.lower
+    return None
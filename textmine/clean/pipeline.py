@@ -0,0 +1,216 @@
+from nltk.stem import PorterStemmer
+from nltk.stem import WordNetLemmatizer
+
+from textmine.clean.normalize import build_normalizer
+from textmine.clean.spell_cache import SpellCorrectionCache
+from textmine.clean.stopwords import load_stopwords
+from textmine.clean.vocabulary import TypeMap, Vocabulary
+
+
+# Letter prepended to the output filename for each enabled stage, in stage order
+STAGE_CODES = (
+    ("convert_to_ascii", "a"),
+    ("remove_line_breaks", "b"),
+    ("remove_punctuation", "p"),
+    ("lower", "l"),
+    ("remove_numbers", "n"),
+    ("spell_check", "s"),
+    ("remove_stopwords", "w"),
+    ("stem", "S"),
+    ("lemmatize", "L"),
+)
+
+
+class CleaningPipeline:
+    """Compiled, reusable comment cleaning stages.
+
+    The stages always run in the order of ``STAGE_CODES``. Every resource (spell
+    checker, stop words, stemmer, lemmatizer) is loaded once when the pipeline
+    is built. The pipeline can then clean any number of files or batches.
+    Pickling sends only the options and the spell cache location, and the
+    pipeline is recompiled on unpickling, so it can be passed to worker
+    processes.
+    """
+
+    def __init__(self,
+                 convert_to_ascii=False,
+                 remove_line_breaks=False,
+                 remove_punctuation=False,
+                 lower=False,
+                 remove_numbers=False,
+                 spell_check=False,
+                 remove_stopwords=False,
+                 stem=False,
+                 lemmatize=False,
+                 custom_stopwords=None,
+                 spell_cache: SpellCorrectionCache=None,
+                 vocabulary_size: int=100000,
+                 verbose=False):
+        """
+        :param custom_stopwords: A string of comma-separated stop words or an iterable of stop words. The NLTK English
+            list is used if empty.
+        :param spell_cache: Memoized spell corrections. A new in-memory cache is used if None.
+        :param vocabulary_size: Maximum number of distinct tokens remembered by the word-level stages. Once exceeded,
+            the vocabulary and the per-token results are cleared before the next comment, so memory stays flat
+            however many files the pipeline cleans.
+        :param verbose: Print each enabled stage while compiling.
+        """
+        self._options = {
+            "convert_to_ascii": convert_to_ascii,
+            "remove_line_breaks": remove_line_breaks,
+            "remove_punctuation": remove_punctuation,
+            "lower": lower,
+            "remove_numbers": remove_numbers,
+            "spell_check": spell_check,
+            "remove_stopwords": remove_stopwords,
+            "stem": stem,
+            "lemmatize": lemmatize,
+            "custom_stopwords": load_stopwords(custom_stopwords) if remove_stopwords else None
+        }
+        self.spell_cache = spell_cache if spell_cache is not None else SpellCorrectionCache()
+        self.vocabulary_size = vocabulary_size
+        self._compile(verbose)
+
+    @classmethod
+    def from_code(cls, code: str, **kwargs) -> 'CleaningPipeline':
+        """
+        :param code: Letter code of the enabled stages, e.g. "apblnswSL". Order does not matter.
+        :param kwargs: Other CleaningPipeline arguments.
+        :return: A compiled pipeline.
+        """
+        letters = {letter: name for name, letter in STAGE_CODES}
+        unknown = set(code) - set(letters)
+        if unknown:
+            raise ValueError(f"Unknown stage letters {''.join(sorted(unknown))!r}. "
+                             f"Expected letters from {''.join(letters)!r}.")
+        return cls(**{letters[letter]: True for letter in code}, **kwargs)
+
+    @property
+    def code(self) -> str:
+        """Letter code of the enabled stages, in stage order. Empty if no stage is enabled."""
+        return "".join(letter for name, letter in STAGE_CODES if self._options[name])
+
+    @property
+    def options(self) -> dict:
+        return dict(self._options)
+
+    def _compile(self, verbose):
+        log = print if verbose else (lambda *args: None)
+        options = self._options
+        stages = []
+
+        # ASCII conversion, line breaks, punctuation, lowercase and numbers all
+        # operate on single characters, so they run as one compiled pass
+        if options["remove_punctuation"]:
+            log("Removing punctuation")
+        if options["lower"]:
+            log("Lower")
+        if options["remove_numbers"]:
+            log("Removing numbers")
+        normalize = build_normalizer(options["convert_to_ascii"],
+                                     options["remove_line_breaks"],
+                                     options["remove_punctuation"],
+                                     options["lower"],
+                                     options["remove_numbers"])
+        if normalize is not None:
+            stages.append(normalize)
+
+        # Spell check, stopwords, stemming and lemmatizing work on words. The
+        # comment is split into an array of token IDs once, every word-level
+        # stage maps or filters that array, and it is joined back into text at
+        # the end. Stopwords, stemming and lemmatizing compute their result
+        # once per unique token
+        vocabulary = Vocabulary()
+        type_maps = []
+        token_stages = []
+        vocabulary_size = self.vocabulary_size
+
+        # Spell check. Every occurrence is looked up in the bounded spell cache,
+        # so repeats count as hits and the cache's LRU size limit applies
+        if options["spell_check"]:
+            log("Spell check")
+            self.spell_cache.warm()
+            correction = self.spell_cache.correct
+            tokens = vocabulary.tokens
+            token_stages.append(lambda ids: [vocabulary.add(correction(tokens[id_])) for id_ in ids])
+
+        # Remove stopwords, either custom or according to nltk toolkit stopwords
+        if options["remove_stopwords"]:
+            log("Removing stop words")
+            stopwords_ = options["custom_stopwords"]
+            stopword_map = TypeMap(vocabulary, lambda word: word.casefold() not in stopwords_)
+            type_maps.append(stopword_map)
+            token_stages.append(stopword_map.select)
+
+        # Stem and lemmatize words
+        morphology = []
+        if options["stem"]:
+            log("Stemming")
+            morphology.append(PorterStemmer().stem)
+        if options["lemmatize"]:
+            log("lemming")
+            lemmer = WordNetLemmatizer()
+            # Load WordNet now rather than on the first comment
+            lemmer.lemmatize("")
+            morphology.append(lemmer.lemmatize)
+        if morphology:
+            if len(morphology) == 1:
+                func = morphology[0]
+            else:
+                stem_, lemmatize_ = morphology
+                func = lambda word: lemmatize_(stem_(word))
+            morphology_map = TypeMap(vocabulary, lambda word: vocabulary.add(func(word)))
+            type_maps.append(morphology_map)
+            token_stages.append(morphology_map.rewrite)
+
+        if token_stages:
+            def clean_words(comment):
+                if len(vocabulary) > vocabulary_size:
+                    vocabulary.clear()
+                    for type_map in type_maps:
+                        type_map.clear()
+                ids = vocabulary.encode(comment.split(" "))
+                for stage in token_stages:
+                    ids = stage(ids)
+                return " ".join(vocabulary.decode(ids))
+            stages.append(clean_words)
+
+        self._stages = stages
+
+    def clean(self, comment: str) -> str:
+        """
+        :param comment: A single comment.
+        :return: The cleaned comment.
+        """
+        for stage in self._stages:
+            comment = stage(comment)
+        return comment
+
+    def transform(self, comments):
+        """
+        :param comments: Iterable of comments. Consumed lazily.
+        :return: Generator of cleaned comments.
+        """
+        clean = self.clean
+        for comment in comments:
+            yield clean(comment)
+
+    def transform_batch(self, comments) -> list:
+        """
+        :param comments: List of comments.
+        :return: List of cleaned comments.
+        """
+        clean = self.clean
+        return [clean(comment) for comment in comments]
+
+    def __getstate__(self):
+        return {"options": self._options,
+                "spell_cache_path": self.spell_cache.path,
+                "spell_cache_size": self.spell_cache.max_size,
+                "vocabulary_size": self.vocabulary_size}
+
+    def __setstate__(self, state):
+        self._options = state["options"]
+        self.spell_cache = SpellCorrectionCache(state["spell_cache_size"], state["spell_cache_path"])
+        self.vocabulary_size = state["vocabulary_size"]
+        self._compile(False)
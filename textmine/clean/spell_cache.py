@@ -0,0 +1,126 @@
+import json
+import os
+from collections import OrderedDict
+
+from spellchecker import SpellChecker
+
+
+class SpellCorrectionCache:
+    """Bounded, persistent memoization of ``SpellChecker.correction``.
+
+    Corrections are stored per token in least-recently-used order. Once more
+    than ``max_size`` tokens are stored, the least recently used ones are
+    evicted. The cache can be saved to and loaded from a JSON file, so later
+    runs start warm. Worker processes can hand back what they learned with
+    :meth:`drain`, and the parent process combines it with :meth:`merge`.
+    """
+
+    def __init__(self, max_size: int=100000, path: str=None, spell: SpellChecker=None):
+        """
+        :param max_size: Maximum number of tokens kept in memory.
+        :param path: JSON file the cache is loaded from if it exists and written to by save().
+        :param spell: Spell checker to memoize. A default English SpellChecker is created on the first miss if None.
+        """
+        self.max_size = max_size
+        self.path = path
+        self._spell = spell
+        self._corrections = OrderedDict()
+        self._new = {}
+        self.hits = 0
+        self.misses = 0
+
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def warm(self):
+        """Load the spell checker's dictionary now instead of on the first miss."""
+        if self._spell is None:
+            self._spell = SpellChecker()
+
+    def correct(self, word: str) -> str:
+        """
+        :param word: Token to correct.
+        :return: The most likely correction, or the token itself if the spell checker has none.
+        """
+        try:
+            corrected = self._corrections[word]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            self._corrections.move_to_end(word)
+            return corrected
+
+        self.misses += 1
+        self.warm()
+        corrected = self._spell.correction(word)
+        if corrected is None:
+            corrected = word
+        self._store(word, corrected)
+        self._new[word] = corrected
+        return corrected
+
+    def _store(self, word, corrected):
+        self._corrections[word] = corrected
+        self._corrections.move_to_end(word)
+        if len(self._corrections) > self.max_size:
+            self._corrections.popitem(last=False)
+
+    def __len__(self):
+        return len(self._corrections)
+
+    def __contains__(self, word):
+        return word in self._corrections
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def drain(self):
+        """Take the corrections computed and the lookups counted since the last drain.
+
+        :return: A tuple of a dict of new corrections, the hit count and the miss count.
+        """
+        new, hits, misses = self._new, self.hits, self.misses
+        self._new = {}
+        self.hits = 0
+        self.misses = 0
+        return new, hits, misses
+
+    def merge(self, corrections, hits: int=0, misses: int=0):
+        """
+        :param corrections: Mapping of token to correction, e.g. from another process's drain().
+        :param hits: Hits counted by the other cache.
+        :param misses: Misses counted by the other cache.
+        """
+        for word, corrected in corrections.items():
+            self._store(word, corrected)
+        self.hits += hits
+        self.misses += misses
+
+    def load(self, path: str):
+        """Load corrections from a JSON file written by save(). Loaded entries count as the least recently used."""
+        with open(path, "r", encoding="utf-8") as f:
+            corrections = json.load(f)
+        loaded = OrderedDict(corrections)
+        loaded.update(self._corrections)
+        self._corrections = loaded
+        while len(self._corrections) > self.max_size:
+            self._corrections.popitem(last=False)
+
+    def save(self, path: str=None):
+        """Write the cache to a JSON file, oldest entries first. The file is replaced atomically.
+
+        :param path: Destination file. Defaults to the path the cache was created with.
+        """
+        path = path or self.path
+        if path is None:
+            raise ValueError("No path given to save the spell correction cache to.")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._corrections, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
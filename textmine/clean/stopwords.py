@@ -0,0 +1,57 @@
+import re
+from functools import lru_cache
+
+from nltk.corpus import stopwords as sw
+
+
+_SEPARATORS = re.compile(r"[,\r\n]+")
+
+
+def parse_stopwords(text: str) -> frozenset:
+    """
+    :param text: Comma or newline separated stop words.
+    :return: Frozen set of the casefolded stop words. Surrounding whitespace and empty entries are dropped.
+    """
+    return frozenset(word.strip().casefold() for word in _SEPARATORS.split(text) if word.strip())
+
+
+@lru_cache(maxsize=None)
+def nltk_stopwords(language: str="english") -> frozenset:
+    """
+    :param language: NLTK stopword list to load.
+    :return: Frozen set of the casefolded NLTK stop words. Loaded once per process.
+    """
+    return frozenset(word.casefold() for word in sw.words(language))
+
+
+@lru_cache(maxsize=32)
+def read_stopwords_file(path: str) -> frozenset:
+    """
+    :param path: Text file of comma or newline separated stop words.
+    :return: Frozen set of the casefolded stop words. Each file is read once per process.
+    """
+    with open(path, "r") as f:
+        return parse_stopwords(f.read())
+
+
+def load_stopwords(custom_stopwords=None, stopwords_file: str=None, language: str="english",
+                   include_nltk: bool=False) -> frozenset:
+    """Resolve every stopword source into one casefolded lookup set.
+
+    :param custom_stopwords: A string of comma-separated stop words, or an iterable of stop words.
+    :param stopwords_file: Text file of comma or newline separated stop words.
+    :param language: NLTK stopword list used if no custom source is given, or if include_nltk is True.
+    :param include_nltk: Add the NLTK stop words to the custom sources instead of replacing them.
+    :return: Frozen set of casefolded stop words. Test tokens against it with ``word.casefold() in stopwords``.
+    """
+    stopwords = set()
+    if custom_stopwords:
+        if isinstance(custom_stopwords, str):
+            stopwords.update(parse_stopwords(custom_stopwords))
+        else:
+            stopwords.update(word.casefold() for word in custom_stopwords)
+    if stopwords_file:
+        stopwords.update(read_stopwords_file(stopwords_file))
+    if include_nltk or not (custom_stopwords or stopwords_file):
+        stopwords.update(nltk_stopwords(language))
+    return frozenset(stopwords)
@@ -0,0 +1,120 @@
+from array import array
+
+
+class Vocabulary:
+    """Mapping between token strings and dense integer IDs.
+
+    IDs are assigned in first-seen order starting at 0, so per-type results can
+    be stored in plain lists indexed by ID.
+    """
+
+    def __init__(self, tokens=()):
+        """
+        :param tokens: Tokens to add up front.
+        """
+        self._ids = {}
+        self._tokens = []
+        for token in tokens:
+            self.add(token)
+
+    def add(self, token: str) -> int:
+        """
+        :param token: Token to look up, added if unseen.
+        :return: The token's ID.
+        """
+        id_ = self._ids.get(token)
+        if id_ is None:
+            id_ = len(self._tokens)
+            self._ids[token] = id_
+            self._tokens.append(token)
+        return id_
+
+    def encode(self, tokens) -> array:
+        """
+        :param tokens: Iterable of tokens. Unseen tokens are added.
+        :return: Array of token IDs.
+        """
+        ids = self._ids
+        encoded = array("l")
+        for token in tokens:
+            id_ = ids.get(token)
+            if id_ is None:
+                id_ = self.add(token)
+            encoded.append(id_)
+        return encoded
+
+    def decode(self, ids):
+        """
+        :param ids: Iterable of token IDs.
+        :return: List of the corresponding tokens.
+        """
+        tokens = self._tokens
+        return [tokens[id_] for id_ in ids]
+
+    def clear(self):
+        """Forget every token. IDs handed out before are no longer valid."""
+        self._ids.clear()
+        self._tokens.clear()
+
+    @property
+    def tokens(self):
+        """Every token, indexed by ID."""
+        return self._tokens
+
+    def __len__(self):
+        return len(self._tokens)
+
+    def __contains__(self, token):
+        return token in self._ids
+
+
+class TypeMap:
+    """Apply a per-token function once per vocabulary type.
+
+    The result for a token ID is computed the first time that ID reaches this
+    map and is reused for every later occurrence. IDs that never reach it, such
+    as tokens produced by later stages, are never mapped. Because corpus text
+    is Zipfian, the function runs far less often than there are token
+    occurrences.
+    """
+
+    def __init__(self, vocabulary: Vocabulary, func):
+        """
+        :param vocabulary: Vocabulary the token IDs come from.
+        :param func: Function taking a single token. It may return a token, a token ID or a flag.
+        """
+        self.vocabulary = vocabulary
+        self._func = func
+        self._mapped = {}
+
+    def _map(self, id_):
+        value = self._mapped[id_] = self._func(self.vocabulary.tokens[id_])
+        return value
+
+    def rewrite(self, ids):
+        """
+        :param ids: Array of token IDs from the vocabulary.
+        :return: List of the mapped values.
+        """
+        mapped = self._mapped
+        map_ = self._map
+        return [mapped[id_] if id_ in mapped else map_(id_) for id_ in ids]
+
+    def select(self, ids):
+        """
+        :param ids: Array of token IDs from the vocabulary.
+        :return: List of the IDs whose mapped value is true, in their original order.
+        """
+        mapped = self._mapped
+        map_ = self._map
+        return [id_ for id_ in ids if (mapped[id_] if id_ in mapped else map_(id_))]
+
+    def clear(self):
+        """Forget every mapped result, e.g. after the vocabulary was cleared."""
+        self._mapped.clear()
+
+    def __call__(self, token: str):
+        return self.rewrite((self.vocabulary.add(token),))[0]
+
+    def __len__(self):
+        return len(self._mapped)
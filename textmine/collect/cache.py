@@ -0,0 +1,259 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+
+# Headers describing the wire encoding, which no longer apply to the decoded body on disk
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+# Eviction stops once the cache is this fraction of max_bytes, so the next
+# stores have room before eviction runs again
+_LOW_WATER = 0.9
+
+
+class ResponseCache:
+    """Persistent on-disk cache of successful GET responses.
+
+    Entries are addressed by a SHA-256 digest of the URL and query parameters
+    and stored as a small JSON metadata file next to a gzip-compressed body.
+    Fresh entries (younger than ``ttl``) are served without touching the
+    network. Stale entries that carry an ``ETag`` or ``Last-Modified`` header
+    are revalidated with a conditional request. The directory is kept under
+    ``max_bytes`` by evicting the least recently used entries down to 90% of
+    the budget. Entry sizes and recency are tracked in memory, so the
+    directory is only scanned once, when the cache is opened.
+
+    Attributes:
+        directory (str): Cache directory
+        ttl (float): Seconds an entry is served without revalidation
+        max_bytes (int): Size budget for the whole cache directory
+    """
+
+    def __init__(self,
+                 directory: str,
+                 ttl: float = 24 * 60 * 60,
+                 max_bytes: int = 1 << 30,
+                 ignore_params: Iterable[str] = ("apiKey", "api-key", "key"),
+                 compress_level: int = 6):
+        """Initialize the cache, creating the directory if needed.
+
+        Args:
+            directory (str): Cache directory
+            ttl (float): Seconds an entry is served without revalidation
+            max_bytes (int): Size budget in bytes, enforced by LRU eviction
+            ignore_params (Iterable[str]): Query parameters left out of the
+                cache key. API keys are excluded by default so rotating keys
+                does not invalidate the cache
+            compress_level (int): gzip level for stored bodies
+        """
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._ignore_params = frozenset(ignore_params)
+        self._compress_level = compress_level
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self._index = self._load_index()
+        self._total_bytes = sum(self._index.values())
+
+    def key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Compute the cache key for a request.
+
+        Args:
+            url (str): Request URL
+            params (dict, optional): Query string parameters
+
+        Returns:
+            str: Hex digest identifying the request
+        """
+        kept = sorted((str(k), str(v)) for k, v in (params or {}).items() if k not in self._ignore_params)
+        return hashlib.sha256(json.dumps([url, kept]).encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load an entry's metadata and mark it as recently used.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            dict: Entry metadata, or None if the request is not cached
+        """
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r") as f:
+                entry = json.load(f)
+            now = time.time()
+            os.utime(meta_path, (now, now))
+            os.utime(body_path, (now, now))
+        except (FileNotFoundError, ValueError):
+            return None
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+        entry["key"] = key
+        return entry
+
+    def is_fresh(self, entry: Dict[str, Any]) -> bool:
+        return time.time() - entry["stored_at"] < self.ttl
+
+    @staticmethod
+    def conditional_headers(entry: Dict[str, Any]) -> Dict[str, str]:
+        """Build revalidation headers for a stale entry.
+
+        Args:
+            entry (dict): Entry metadata
+
+        Returns:
+            dict: ``If-None-Match``/``If-Modified-Since`` headers, possibly empty
+        """
+        headers = CaseInsensitiveDict(entry["headers"])
+        conditional = {}
+        if "etag" in headers:
+            conditional["If-None-Match"] = headers["etag"]
+        if "last-modified" in headers:
+            conditional["If-Modified-Since"] = headers["last-modified"]
+        return conditional
+
+    def store(self, key: str, response: requests.Response):
+        """Store a successful response, then evict old entries if over budget.
+
+        Args:
+            key (str): Cache key
+            response (Response): Response with status 200
+        """
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in _DROPPED_HEADERS}
+        entry = {"url": response.url, "status_code": response.status_code, "headers": headers,
+                 "stored_at": time.time()}
+        body = gzip.compress(response.content, compresslevel=self._compress_level)
+        self._write(key, entry, body)
+        self._evict()
+
+    def refresh(self, key: str, entry: Dict[str, Any]):
+        """Restart an entry's TTL after a 304 Not Modified response.
+
+        Args:
+            key (str): Cache key
+            entry (dict): Entry metadata returned by :meth:`lookup`
+        """
+        entry = {k: v for k, v in entry.items() if k != "key"}
+        entry["stored_at"] = time.time()
+        meta_path, _ = self._paths(key)
+        with self._lock:
+            old_size = self._size(meta_path)
+            self._atomic_write(meta_path, json.dumps(entry).encode("utf-8"))
+            delta = self._size(meta_path) - old_size
+            self._total_bytes += delta
+            if key in self._index:
+                self._index[key] += delta
+                self._index.move_to_end(key)
+
+    def to_response(self, entry: Dict[str, Any]) -> Optional[requests.Response]:
+        """Rebuild a ``requests.Response`` from a cached entry.
+
+        Args:
+            entry (dict): Entry metadata returned by :meth:`lookup`
+
+        Returns:
+            Response: Response with ``from_cache`` set to True, or None if the
+            body was evicted in the meantime
+        """
+        _, body_path = self._paths(entry["key"])
+        try:
+            with open(body_path, "rb") as f:
+                body = gzip.decompress(f.read())
+        except FileNotFoundError:
+            return None
+
+        response = requests.Response()
+        response.status_code = entry["status_code"]
+        response.reason = "OK"
+        response.url = entry["url"]
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.from_cache = True
+        return response
+
+    def clear(self):
+        """Delete every cached entry."""
+        with self._lock:
+            for path in self._entry_files():
+                os.remove(path)
+            self._index.clear()
+            self._total_bytes = 0
+
+    @property
+    def size(self) -> int:
+        return self._total_bytes
+
+    def _paths(self, key: str):
+        base = os.path.join(self.directory, key[:2], key)
+        return base + ".json", base + ".gz"
+
+    def _entry_files(self):
+        for root, _, files in os.walk(self.directory):
+            for file in files:
+                if file.endswith(".json") or file.endswith(".gz"):
+                    yield os.path.join(root, file)
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """Scan the directory once for each entry's size, ordered from least to most recently used."""
+        entries = {}
+        for path in self._entry_files():
+            key = os.path.splitext(os.path.basename(path))[0]
+            stat = os.stat(path)
+            last_used, size = entries.get(key, (0.0, 0))
+            entries[key] = (max(last_used, stat.st_mtime), size + stat.st_size)
+        return OrderedDict((key, size) for key, (_, size) in sorted(entries.items(), key=lambda item: item[1][0]))
+
+    @staticmethod
+    def _size(path: str) -> int:
+        try:
+            return os.path.getsize(path)
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _atomic_write(path: str, data: bytes):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _write(self, key: str, entry: Dict[str, Any], body: bytes):
+        meta_path, body_path = self._paths(key)
+        os.makedirs(os.path.dirname(meta_path), exist_ok=True)
+        with self._lock:
+            old_size = self._size(meta_path) + self._size(body_path)
+            # Body first so a visible metadata file always has its body
+            self._atomic_write(body_path, body)
+            self._atomic_write(meta_path, json.dumps(entry).encode("utf-8"))
+            new_size = self._size(meta_path) + self._size(body_path)
+            self._total_bytes += new_size - old_size
+            self._index[key] = new_size
+            self._index.move_to_end(key)
+
+    def _evict(self):
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+            target = self.max_bytes * _LOW_WATER
+            while self._index and self._total_bytes > target:
+                key, size = self._index.popitem(last=False)
+                for path in self._paths(key):
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+                self._total_bytes -= size
@@ -1,3 +1,5 @@
 from .api import *
+from .browser import *
 from .webscrape import *
-
+from .registry import *
+from .batch import *
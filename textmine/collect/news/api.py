@@ -1,7 +1,9 @@
 import requests
 import abc
-from typing import Tuple, Union, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Union, Dict, Any, Iterator, List, Optional
 from ...parse_json import ParseJsonBase
+from ..session import HttpSession, get_default_session
 
 
 def read_api_key_from_file(path_to_file: str):
@@ -35,18 +37,28 @@ class BaseApiGetRequest(abc.ABC):
         _parser (ParseJsonBase): Optional response parser
         _params (Dict): Request parameters
         _response (Response): Last API response
+        _session (HttpSession): Pooled session used for every request
     """
 
-    def __init__(self, api_key_: str, parser: ParseJsonBase=None):
+    # Pagination settings, overridden by endpoints with different conventions
+    _api_key_param = "apiKey"
+    _page_param = "page"
+    _first_page = 1
+    _last_page = None
+
+    def __init__(self, api_key_: str, parser: ParseJsonBase=None, session: HttpSession=None):
         """Initialize API request handler.
         
         Args:
             api_key_ (str): API authentication key
             parser (ParseJsonBase, optional): Response parser
+            session (HttpSession, optional): Pooled session. Defaults to the
+                shared process-wide session
         """
         self._api_key = api_key_
         self._endpoint = None
         self._parser = parser
+        self._session = session if session is not None else get_default_session()
         self._params: Dict[str, Any] = {}
         self._response = None
 
@@ -79,6 +91,99 @@ class BaseApiGetRequest(abc.ABC):
         else:
             return self.response.url
 
+    def _page_items(self, json_data: Dict) -> List[Dict]:
+        """Get the articles contained in one page of results."""
+        return json_data.get("articles") or []
+
+    def _total_results(self, json_data: Dict) -> Optional[int]:
+        """Get the total number of results the query matches, if reported."""
+        return json_data.get("totalResults")
+
+    def iter_pages(self, max_pages: int=None, prefetch: bool=True) -> Iterator[Dict]:
+        """Lazily request consecutive pages of the current query.
+
+        The parameters set so far are captured once, so the query does not have
+        to be rebuilt for each page. While one page is being consumed the next
+        one is already being fetched in the background. Iteration stops after
+        the last page that ``totalResults`` allows, at an empty page, at
+        ``max_pages``, or at the first non-200 response. That includes quota
+        errors such as 426 and 429. The failing response is then available
+        through :attr:`response`.
+
+        Args:
+            max_pages (int, optional): Maximum number of pages to request
+            prefetch (bool): Fetch the next page while the current one is consumed
+
+        Yields:
+            dict: Raw JSON data of each page
+        """
+        params = dict(self._params)
+        self._params.clear()
+        params[self._api_key_param] = self._api_key
+        page = params.get(self._page_param, self._first_page)
+
+        def fetch(page_):
+            return self._session.get(self._endpoint, params={**params, self._page_param: page_})
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        pending = executor.submit(fetch, page)
+        pages_read = 0
+        articles_read = 0
+        try:
+            while pending is not None:
+                self._response = pending.result()
+                pending = None
+                if self._response.status_code != 200:
+                    break
+
+                json_data = self._response.json()
+                items = self._page_items(json_data)
+                if len(items) == 0:
+                    break
+
+                pages_read += 1
+                articles_read += len(items)
+                total = self._total_results(json_data)
+                has_next = ((total is None or articles_read < total)
+                            and (max_pages is None or pages_read < max_pages)
+                            and (self._last_page is None or page < self._last_page))
+                page += 1
+                if has_next:
+                    if prefetch:
+                        pending = executor.submit(fetch, page)
+                    yield json_data
+                    if not prefetch:
+                        pending = executor.submit(fetch, page)
+                else:
+                    yield json_data
+        finally:
+            if pending is not None:
+                pending.cancel()
+            executor.shutdown(wait=False)
+
+    def iter_articles(self, max_results: int=None, max_pages: int=None, prefetch: bool=True) -> Iterator[Dict]:
+        """Lazily stream articles across pages of the current query.
+
+        Articles are run through the parser if one was given, otherwise the raw
+        article dicts are yielded.
+
+        Args:
+            max_results (int, optional): Stop after this many articles
+            max_pages (int, optional): Maximum number of pages to request
+            prefetch (bool): Fetch the next page while the current one is consumed
+
+        Yields:
+            dict: One article at a time
+        """
+        count = 0
+        for json_data in self.iter_pages(max_pages, prefetch):
+            articles = self._parser.parse(json_data) if self._parser is not None else self._page_items(json_data)
+            for article in articles:
+                if max_results is not None and count >= max_results:
+                    return
+                yield article
+                count += 1
+
 
 class NewsApiDotOrgEverything(BaseApiGetRequest):
     """NewsAPI.org /everything endpoint implementation.
@@ -90,14 +195,15 @@ class NewsApiDotOrgEverything(BaseApiGetRequest):
         _parser (ParseJsonBase): Optional response parser
     """
 
-    def __init__(self, api_key_: str, parser: ParseJsonBase=None):
+    def __init__(self, api_key_: str, parser: ParseJsonBase=None, session: HttpSession=None):
         """Initialize everything endpoint.
         
         Args:
             api_key_ (str): NewsAPI authentication key
             parser (ParseJsonBase, optional): Response parser
+            session (HttpSession, optional): Pooled session
         """
-        super().__init__(api_key_, parser)
+        super().__init__(api_key_, parser, session)
         self._endpoint = "https://newsapi.org/v2/everything"
 
     def q(self, q_: str) -> 'NewsApiDotOrgEverything':
@@ -240,7 +346,7 @@ class NewsApiDotOrgEverything(BaseApiGetRequest):
             parsed JSON response or raw Response object
         """
         self._params["apiKey"] = self._api_key
-        self._response = requests.get(self._endpoint, params=self._params)
+        self._response = self._session.get(self._endpoint, params=self._params)
         self._params.clear()
         if self._response.status_code == 200:
             if self._parser is not None:
@@ -258,14 +364,15 @@ class NewsApiDotOrgHeadlines(BaseApiGetRequest):
     Note: country/category parameters cannot be mixed with sources parameter.
     """
 
-    def __init__(self, api_key_: str, parser: ParseJsonBase):
+    def __init__(self, api_key_: str, parser: ParseJsonBase, session: HttpSession=None):
         """Initialize headlines endpoint.
         
         Args:
             api_key_ (str): NewsAPI authentication key  
             parser (ParseJsonBase): Response parser
+            session (HttpSession, optional): Pooled session
         """
-        super().__init__(api_key_, parser)
+        super().__init__(api_key_, parser, session)
         self._endpoint = "https://newsapi.org/v2/top-headlines"
 
     def country(self, country_: str) -> 'NewsApiDotOrgHeadlines':
@@ -348,7 +455,7 @@ class NewsApiDotOrgHeadlines(BaseApiGetRequest):
             parsed JSON response or raw Response object
         """
         self._params["apiKey"] = self._api_key
-        self._response = requests.get(self._endpoint, params=self._params)
+        self._response = self._session.get(self._endpoint, params=self._params)
         self._params.clear()
         if self._response.status_code == 200:
             return True, self._response.json()
@@ -356,8 +463,13 @@ class NewsApiDotOrgHeadlines(BaseApiGetRequest):
 
 
 class NytApi(BaseApiGetRequest):
-    def __init__(self, api_key_: str, parser: ParseJsonBase=None):
-        super().__init__(api_key_, parser)
+    _api_key_param = "api-key"
+    _first_page = 0
+    # The article search API refuses pages past 100
+    _last_page = 100
+
+    def __init__(self, api_key_: str, parser: ParseJsonBase=None, session: HttpSession=None):
+        super().__init__(api_key_, parser, session)
 
         self._endpoint = "https://api.nytimes.com/svc/search/v2/articlesearch.json"
 
@@ -369,10 +481,17 @@ class NytApi(BaseApiGetRequest):
         self._params["q"] = query
         return self
 
+    def _page_items(self, json_data: Dict) -> List[Dict]:
+        return (json_data.get("response") or {}).get("docs") or []
+
+    def _total_results(self, json_data: Dict) -> Optional[int]:
+        response = json_data.get("response") or {}
+        meta = response.get("meta") or response.get("metadata") or {}
+        return meta.get("hits")
 
     def get(self) -> Tuple[bool, Union[Dict, requests.Response]]:
         self._params["api-key"] = self._api_key
-        self._response = requests.get(self._endpoint, params=self._params)
+        self._response = self._session.get(self._endpoint, params=self._params)
         self._params.clear()
         if self._response.status_code == 200:
             if self._parser is not None:
@@ -0,0 +1,295 @@
+import atexit
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from selenium import webdriver
+from selenium.common.exceptions import InvalidSessionIdException, TimeoutException, WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as ec
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+WaitStrategy = Callable[[WebDriver], None]
+
+# Clears the storage of the current origin. Pages such as about:blank have no
+# storage and throw, which is not an error here
+_CLEAR_STORAGE_SCRIPT = ("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+
+
+def wait_for_ready_state(timeout: float=10) -> WaitStrategy:
+    """Wait until ``document.readyState`` is ``complete``.
+
+    Args:
+        timeout (float): Seconds to wait before giving up silently
+
+    Returns:
+        Callable: Wait strategy for :class:`BrowserPool`
+    """
+    def wait(driver: WebDriver):
+        try:
+            WebDriverWait(driver, timeout).until(
+                lambda d: d.execute_script("return document.readyState") == "complete")
+        except TimeoutException:
+            pass
+    return wait
+
+
+def wait_for_element(by: str, value: str, timeout: float=10) -> WaitStrategy:
+    """Wait until an element is present in the DOM.
+
+    Args:
+        by (str): Selenium locator strategy, e.g. ``By.CSS_SELECTOR``
+        value (str): Locator value
+        timeout (float): Seconds to wait before giving up silently
+
+    Returns:
+        Callable: Wait strategy for :class:`BrowserPool`
+    """
+    def wait(driver: WebDriver):
+        try:
+            WebDriverWait(driver, timeout).until(ec.presence_of_element_located((by, value)))
+        except TimeoutException:
+            pass
+    return wait
+
+
+def wait_for_element_count(by: str, value: str, count: int, timeout: float=10) -> WaitStrategy:
+    """Wait until at least ``count`` matching elements are in the DOM, e.g.
+    until a "load more" click has rendered new results.
+
+    Args:
+        by (str): Selenium locator strategy, e.g. ``By.CSS_SELECTOR``
+        value (str): Locator value
+        count (int): Minimum number of matching elements
+        timeout (float): Seconds to wait before giving up silently
+
+    Returns:
+        Callable: Wait strategy for :class:`BrowserPool`
+    """
+    def wait(driver: WebDriver):
+        try:
+            WebDriverWait(driver, timeout).until(lambda d: len(d.find_elements(by, value)) >= count)
+        except TimeoutException:
+            pass
+    return wait
+
+
+def wait_fixed(seconds: float) -> WaitStrategy:
+    """Sleep for a fixed time. Only useful for pages with no reliable ready signal.
+
+    Args:
+        seconds (float): Seconds to sleep
+
+    Returns:
+        Callable: Wait strategy for :class:`BrowserPool`
+    """
+    def wait(driver: WebDriver):
+        time.sleep(seconds)
+    return wait
+
+
+def _headless_driver(browser: str, headless: bool) -> WebDriver:
+    if browser == "firefox":
+        options = webdriver.FirefoxOptions()
+        if headless:
+            options.add_argument("-headless")
+        return webdriver.Firefox(options=options)
+    elif browser == "chrome":
+        options = webdriver.ChromeOptions()
+        if headless:
+            options.add_argument("--headless=new")
+        return webdriver.Chrome(options=options)
+    raise ValueError(f"Unsupported browser '{browser}'. Expected 'firefox' or 'chrome'.")
+
+
+def _session_lost(driver: WebDriver, error: Exception) -> bool:
+    """Whether an error left the driver unusable, i.e. its session is gone or the browser crashed or is unreachable."""
+    if isinstance(error, InvalidSessionIdException):
+        return True
+    try:
+        driver.current_window_handle
+    except Exception:
+        return True
+    return False
+
+
+class _Slot:
+    def __init__(self):
+        self.driver: Optional[WebDriver] = None
+        self.pages = 0
+
+
+class BrowserPool:
+    """Pool of long-lived headless browsers shared across page loads.
+
+    Drivers are started lazily on first checkout, reused for up to
+    ``max_pages`` page loads and then restarted. Routine Selenium errors
+    (missing elements, timeouts, stale elements) return the driver to the
+    pool. It is only discarded and replaced on the next checkout if its
+    session was lost. Cookies and the current page's local and session
+    storage are cleared when a driver is returned, so state such as metered
+    paywalls does not carry over between pages.
+
+    Attributes:
+        size (int): Maximum number of live drivers
+        max_pages (int): Page loads before a driver is recycled
+        clear_state (bool): Clear cookies and storage when a driver is returned
+    """
+
+    def __init__(self,
+                 size: int=2,
+                 max_pages: int=50,
+                 browser: str="firefox",
+                 headless: bool=True,
+                 page_load_timeout: float=30,
+                 driver_factory: Callable[[], WebDriver]=None,
+                 clear_state: bool=True):
+        """Initialize the pool. No browser is started until first use.
+
+        Args:
+            size (int): Maximum number of live drivers
+            max_pages (int): Page loads before a driver is recycled
+            browser (str): ``firefox`` or ``chrome``
+            headless (bool): Run browsers without a display
+            page_load_timeout (float): Selenium page load timeout in seconds
+            driver_factory (Callable, optional): Creates a driver. Overrides
+                ``browser`` and ``headless``, e.g. to point at a remote grid
+            clear_state (bool): Clear cookies and storage when a driver is
+                returned. Disable only for sites that need a session kept
+                across pages
+        """
+        self.size = size
+        self.max_pages = max_pages
+        self.clear_state = clear_state
+        self._page_load_timeout = page_load_timeout
+        self._driver_factory = driver_factory or (lambda: _headless_driver(browser, headless))
+        self._slots: "queue.Queue[_Slot]" = queue.Queue()
+        self._all_slots: List[_Slot] = []
+        for _ in range(size):
+            slot = _Slot()
+            self._slots.put(slot)
+            self._all_slots.append(slot)
+        self._closed = False
+
+    def _start(self, slot: _Slot):
+        slot.driver = self._driver_factory()
+        slot.driver.set_page_load_timeout(self._page_load_timeout)
+        slot.pages = 0
+
+    @staticmethod
+    def _stop(slot: _Slot):
+        if slot.driver is not None:
+            try:
+                slot.driver.quit()
+            except WebDriverException:
+                pass
+        slot.driver = None
+        slot.pages = 0
+
+    def _clear_state(self, slot: _Slot):
+        try:
+            slot.driver.delete_all_cookies()
+            slot.driver.execute_script(_CLEAR_STORAGE_SCRIPT)
+        except WebDriverException:
+            # A driver whose state cannot be cleared is not reused
+            self._stop(slot)
+
+    @contextmanager
+    def driver(self, timeout: float=None) -> Iterator[WebDriver]:
+        """Check out a driver for one page load.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free driver
+
+        Yields:
+            WebDriver: A live driver, returned to the pool on exit
+        """
+        if self._closed:
+            raise RuntimeError("BrowserPool is closed.")
+
+        slot = self._slots.get(timeout=timeout)
+        try:
+            if slot.driver is None:
+                self._start(slot)
+            try:
+                yield slot.driver
+            except Exception as error:
+                if _session_lost(slot.driver, error):
+                    self._stop(slot)
+                raise
+            finally:
+                if slot.driver is not None:
+                    slot.pages += 1
+                    if slot.pages >= self.max_pages:
+                        self._stop(slot)
+                    elif self.clear_state:
+                        self._clear_state(slot)
+        finally:
+            self._slots.put(slot)
+
+    def fetch(self, url: str, wait: WaitStrategy=None) -> str:
+        """Load a page and return its rendered HTML.
+
+        Args:
+            url (str): Page to load
+            wait (Callable, optional): Wait strategy run after navigation.
+                Defaults to :func:`wait_for_ready_state`
+
+        Returns:
+            str: ``driver.page_source`` after waiting
+        """
+        with self.driver() as driver:
+            driver.get(url)
+            (wait or wait_for_ready_state())(driver)
+            return driver.page_source
+
+    def close(self):
+        """Quit every live driver."""
+        self._closed = True
+        for slot in self._all_slots:
+            self._stop(slot)
+
+    def __enter__(self) -> 'BrowserPool':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+_default_pools: Dict[str, BrowserPool] = {}
+_default_lock = threading.Lock()
+
+
+def get_default_browser_pool(browser: str="firefox") -> BrowserPool:
+    """Get the process-wide pool for a browser, creating it on first use.
+
+    Args:
+        browser (str): ``firefox`` or ``chrome``
+
+    Returns:
+        BrowserPool: Shared pool, closed automatically at interpreter exit
+    """
+    with _default_lock:
+        if browser not in _default_pools:
+            _default_pools[browser] = BrowserPool(browser=browser)
+        return _default_pools[browser]
+
+
+def set_default_browser_pool(pool: BrowserPool, browser: str="firefox"):
+    """Replace the process-wide pool for a browser.
+
+    Args:
+        pool (BrowserPool): Pool to use when none is passed explicitly
+        browser (str): ``firefox`` or ``chrome``
+    """
+    with _default_lock:
+        _default_pools[browser] = pool
+
+
+@atexit.register
+def _close_default_pools():
+    for pool in _default_pools.values():
+        pool.close()
@@ -0,0 +1,118 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+from urllib.parse import urlparse
+
+
+# Registered domain (lowercase, no "www.") -> scraper class
+_SCRAPERS: Dict[str, Type] = {}
+
+
+def _normalize_host(netloc: str) -> str:
+    host = netloc.rsplit("@", 1)[-1].split(":", 1)[0].lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+def register_scraper(scraper_cls: Type) -> Type:
+    """Register a scraper class under every domain its ``get_domain()`` returns.
+
+    ``get_domain()`` may return several comma-separated domains. Scrapers that
+    return an empty string are not registered. Subclasses of
+    ``BaseWebscrapeContent`` are registered automatically when defined, so this
+    is only needed for classes loaded some other way. Can be used as a decorator.
+
+    Args:
+        scraper_cls (type): Scraper class with a static ``get_domain()``
+
+    Returns:
+        type: The scraper class, unchanged
+    """
+    domains = scraper_cls.get_domain() or ""
+    for domain in domains.split(","):
+        domain = _normalize_host(domain.strip())
+        if domain:
+            _SCRAPERS[domain] = scraper_cls
+    return scraper_cls
+
+
+def unregister_scraper(scraper_cls: Type):
+    """Remove every domain registered to a scraper class.
+
+    Args:
+        scraper_cls (type): Previously registered scraper class
+    """
+    for domain in [domain for domain, cls in _SCRAPERS.items() if cls is scraper_cls]:
+        del _SCRAPERS[domain]
+
+
+def registered_domains() -> Dict[str, Type]:
+    """Get a copy of the domain-to-scraper mapping.
+
+    Returns:
+        Dict[str, type]: Registered domains and their scraper classes
+    """
+    return dict(_SCRAPERS)
+
+
+def scraper_for_url(url: str) -> Optional[Type]:
+    """Find the scraper class for a URL.
+
+    The host is matched exactly first, then with leading subdomain labels
+    stripped one at a time, so ``edition.cnn.com`` resolves to the ``cnn.com``
+    scraper. Each step is a single dict lookup.
+
+    Args:
+        url (str): Article URL
+
+    Returns:
+        type: Matching scraper class, or None if no scraper handles the domain
+    """
+    host = _normalize_host(urlparse(url).netloc)
+    while host:
+        scraper_cls = _SCRAPERS.get(host)
+        if scraper_cls is not None:
+            return scraper_cls
+        host = host.partition(".")[2]
+    return None
+
+
+def route_urls(urls: Iterable[str]) -> Tuple[Dict[Type, List[str]], List[str]]:
+    """Group URLs by their scraper class.
+
+    Args:
+        urls (Iterable[str]): Article URLs from any mix of outlets
+
+    Returns:
+        Tuple[Dict[type, List[str]], List[str]]: URLs grouped by scraper class
+        in input order, and the URLs no scraper handles
+    """
+    routed: Dict[Type, List[str]] = {}
+    unmatched: List[str] = []
+    for url in urls:
+        scraper_cls = scraper_for_url(url)
+        if scraper_cls is None:
+            unmatched.append(url)
+        else:
+            routed.setdefault(scraper_cls, []).append(url)
+    return routed, unmatched
+
+
+def route_documents(documents: Iterable[Dict]) -> Tuple[Dict[Type, List[Dict]], List[Dict]]:
+    """Group parsed documents, e.g. ``ParseNewsApiDotOrg`` output, by scraper class.
+
+    Args:
+        documents (Iterable[dict]): Documents with a ``url`` key
+
+    Returns:
+        Tuple[Dict[type, List[dict]], List[dict]]: Documents grouped by scraper
+        class in input order, and the documents no scraper handles
+    """
+    routed: Dict[Type, List[Dict]] = {}
+    unmatched: List[Dict] = []
+    for document in documents:
+        scraper_cls = scraper_for_url(document["url"])
+        if scraper_cls is None:
+            unmatched.append(document)
+        else:
+            routed.setdefault(scraper_cls, []).append(document)
+    return routed, unmatched
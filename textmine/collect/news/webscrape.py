@@ -1,59 +1,199 @@
 import abc
+import inspect
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 
-import requests
-from bs4 import BeautifulSoup
-from selenium import webdriver
-import time
-import random
+from bs4 import BeautifulSoup, SoupStrainer
 
 from selenium.common import ElementNotInteractableException
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.common.exceptions import TimeoutException
 
-import json
 import re
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver import ActionChains
 from newspaper import Article
 
+from ...utils.checkpoint import CheckpointJournal
+from ..session import HttpSession, get_default_session
+from ..throttle import DomainScheduler, get_default_scheduler
+from .browser import (BrowserPool, WaitStrategy, get_default_browser_pool, wait_for_element, wait_for_element_count,
+                      wait_for_ready_state)
+from .registry import register_scraper
+
+
+PARSER_BACKENDS = ("lxml", "html.parser", "html5lib")
+
+try:
+    import lxml  # noqa: F401
+    _parser_backend = "lxml"
+except ImportError:
+    _parser_backend = "html.parser"
+
+
+def set_parser_backend(backend: str):
+    """Set the BeautifulSoup tree builder used for every scraped page.
+
+    Args:
+        backend (str): One of ``PARSER_BACKENDS``. ``lxml`` is the default when
+            installed and is several times faster than ``html.parser``
+    """
+    global _parser_backend
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend '{backend}'. Expected one of {PARSER_BACKENDS}.")
+    _parser_backend = backend
+
+
+def get_parser_backend() -> str:
+    return _parser_backend
+
+
+def _parse_html(markup, parse_only: SoupStrainer=None, parser: str=None):
+    return BeautifulSoup(markup, parser or _parser_backend, parse_only=parse_only)
+
 
 def _htmlify_query(query):
     return query.replace(" ", "+")
 
 
-def _html_soup(content: str, headers=None):
+def _html_soup(content: str, headers=None, session: HttpSession=None, parse_only: SoupStrainer=None):
     # headers = {
     #     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/50.0.2661.102 Safari/537.36'}
-    response = requests.get(content, headers=headers)
-    # return BeautifulSoup(response.content, "html5lib")
-    return BeautifulSoup(response.content, "html.parser")
+    if session is None:
+        session = get_default_session()
+    response = session.get(content, headers=headers)
+    return _parse_html(response.content, parse_only)
+
+
+def _paginate_search(build_endpoint: Callable[[int], str],
+                     extract_links: Callable[[BeautifulSoup], Optional[List[str]]],
+                     max_results: Optional[int]=1000,
+                     first_page: int=1,
+                     prefetch: int=4,
+                     session: HttpSession=None,
+                     checkpoint: CheckpointJournal=None):
+    """Walk numbered search-results pages, fetching several pages ahead.
+
+    Up to ``prefetch`` pages are in flight at once, but pages are consumed in
+    order. Links are de-duplicated incrementally in first-seen order. Stops at
+    the first page for which ``extract_links`` returns None, or once
+    ``max_results`` links have been collected.
+
+    With a checkpoint journal, every page's links are journaled under the
+    first page's URL. A rerun continues from the page after the last one
+    read, or returns the saved links if the crawl had finished.
+
+    Args:
+        build_endpoint (Callable[[int], str]): Maps a page number to its URL
+        extract_links (Callable): Returns the links on a page, or None if the
+            page has no results
+        max_results (int, optional): Maximum links to return. None for no limit
+        first_page (int): Number of the first page to request
+        prefetch (int): Number of pages fetched concurrently
+        session (HttpSession, optional): Pooled session
+        checkpoint (CheckpointJournal, optional): Journal used to resume an
+            interrupted crawl
+
+    Returns:
+        Tuple[List[str], BeautifulSoup]: Links, and the soup of the last page read
+    """
+    if session is None:
+        session = get_default_session()
+
+    links = {}
+    soup = None
+    next_page = first_page
+    key = build_endpoint(first_page)
+
+    # The crawl is never marked done in the journal, because that would discard
+    # its links. A final page token of None records that it finished
+    def finish():
+        result = list(links)
+        return (result[:max_results] if max_results is not None else result), soup
+
+    if checkpoint is not None:
+        resumed = checkpoint.resume(key)
+        if resumed is not None:
+            page_token, saved_links = resumed
+            for link in saved_links:
+                links.setdefault(link, None)
+            if page_token is None:
+                return finish()
+            next_page = page_token
+    if max_results is not None and len(links) >= max_results:
+        return finish()
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending = deque()
+    try:
+        for _ in range(prefetch):
+            pending.append(executor.submit(_html_soup, build_endpoint(next_page), session=session))
+            next_page += 1
+
+        # Page number of the page at the head of the queue
+        page = next_page - prefetch
+        while pending:
+            soup = pending.popleft().result()
+            page_links = extract_links(soup)
+            if page_links is None:
+                if checkpoint is not None:
+                    checkpoint.record_page(key, None, [])
+                break
+
+            new_links = []
+            for link in page_links:
+                if link not in links:
+                    links[link] = None
+                    new_links.append(link)
+            page += 1
+            if checkpoint is not None:
+                checkpoint.record_page(key, page, new_links)
+            if max_results is not None and len(links) >= max_results:
+                break
+
+            pending.append(executor.submit(_html_soup, build_endpoint(next_page), session=session))
+            next_page += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
 
+    return finish()
 
-def selenium_soup(content: str, check_for_modal: bool=False, browser="chrome"):
-    driver = webdriver.Firefox()
-    driver.get(content)
+
+def selenium_soup(content: str,
+                  check_for_modal: bool=False,
+                  browser="firefox",
+                  parse_only: SoupStrainer=None,
+                  pool: BrowserPool=None,
+                  wait: WaitStrategy=None,
+                  scheduler: DomainScheduler=None):
+    if pool is None:
+        pool = get_default_browser_pool(browser)
+    if scheduler is None:
+        scheduler = get_default_scheduler()
 
     try:
-        if check_for_modal:
-            try:
-                modal = WebDriverWait(driver, random.uniform(5, 10)).until(
-                    ec.visibility_of_element_located((By.CLASS_NAME, "css-j07ljx")))
-                time.sleep(random.uniform(0.5, 1.5))
-                modal.click()
-            except TimeoutException:
-                pass
-
-        html_info = driver.page_source
-        
-        time.sleep(random.uniform(2, 5))
-        driver.quit()
-        
-        return BeautifulSoup(html_info, "html.parser")
-    
+        with pool.driver() as driver:
+            scheduler.acquire(content, get_default_session().fetch_robots)
+            driver.get(content)
+            (wait or wait_for_ready_state())(driver)
+
+            if check_for_modal:
+                try:
+                    modal = WebDriverWait(driver, 5).until(
+                        ec.element_to_be_clickable((By.CLASS_NAME, "css-j07ljx")))
+                    modal.click()
+                except TimeoutException:
+                    pass
+
+            html_info = driver.page_source
+
+        return _parse_html(html_info, parse_only)
+
     except Exception as e:
         print(f"Error during page load: {e}")
-        driver.quit()
         return None
 
 def write_soup_html(soup):
@@ -62,10 +202,20 @@ def write_soup_html(soup):
 
 
 class BaseWebscrapeContent(abc.ABC):
-    def __init__(self):
+    # Restricts article pages to the elements the scrape_* methods read, so the
+    # rest of the page is never built into a tree. None parses the whole page.
+    parse_only: SoupStrainer = None
+
+    def __init__(self, session: HttpSession=None):
         self._title = None
         self._site_content = None
         self._soup = None
+        self._session = session if session is not None else get_default_session()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if not inspect.isabstract(cls):
+            register_scraper(cls)
 
     @staticmethod
     @abc.abstractmethod
@@ -96,6 +246,10 @@ class BaseWebscrapeContent(abc.ABC):
     def soup(self):
         return self._soup
 
+    @property
+    def session(self):
+        return self._session
+
 
 class BaseGetResults(abc.ABC):
     def __init__(self):
@@ -107,15 +261,17 @@ class BaseGetResults(abc.ABC):
         pass
 
 class ScrapeAPContent(BaseWebscrapeContent, BaseGetResults):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(attrs={"class": re.compile("Page-headline|RichTextStoryBody")})
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain() -> str:
         return "apnews.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self._soup.find("h1", class_="Page-headline").text
@@ -129,48 +285,36 @@ class ScrapeAPContent(BaseWebscrapeContent, BaseGetResults):
                 text_list.append(tag.text)
         self._site_content = " ".join(text_list)
 
-    def get_search_results(self, query, max_results=1000):
-        page = 1
-        links = []
-
-        while True:
-
-            page += 1
-            endpoint = f"https://apnews.com/search?q={_htmlify_query(query)}&s=0&p={page}"
-            self.make_soup(endpoint)
-            tags = self.soup.find_all("a", {"class": re.compile("Link.*")})
-
-            if len(tags) == 0:
-                break
-
-            for tag in tags:
-                try:
-                    link = tag["href"]
-                    if "article" in link:
-                        links.append(link)
-                except KeyError:
-                    continue
-
-            links = list(set(links))
-            if len(links) >= max_results:
-                break
-
-        if len(links) > max_results:
-            return links[:max_results]
-
+    @staticmethod
+    def _search_page_links(soup):
+        tags = soup.find_all("a", {"class": re.compile("Link.*")})
+        if len(tags) == 0:
+            return None
+        return [tag["href"] for tag in tags if "article" in tag.get("href", "")]
+
+    def get_search_results(self, query, max_results=1000, checkpoint: CheckpointJournal=None):
+        query = _htmlify_query(query)
+        links, self._soup = _paginate_search(lambda page: f"https://apnews.com/search?q={query}&s=0&p={page}",
+                                             self._search_page_links,
+                                             max_results,
+                                             first_page=2,
+                                             session=self._session,
+                                             checkpoint=checkpoint)
         return links
 
 
 class ScrapeCNNContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(["h1", "p"])
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "cnn.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self.soup.find("h1", id="maincontent").text
@@ -187,15 +331,17 @@ class ScrapeCNNContent(BaseWebscrapeContent):
 
 
 class ScrapeNYTContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(["h1", "p"])
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "nytimes.com"
 
     def make_soup(self, url: str):
-        self._soup = selenium_soup(url, True)
+        self._soup = selenium_soup(url, True, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self.soup.find("h1", class_="css-1fyu99 e1h9rw200")
@@ -209,15 +355,17 @@ class ScrapeNYTContent(BaseWebscrapeContent):
 
 
 class ScrapeBBCContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer("article")
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "bbc.com,bbc.co.uk"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self.soup.select("article > div > h1")[0].text
@@ -231,15 +379,17 @@ class ScrapeBBCContent(BaseWebscrapeContent):
 
 
 class ScrapeMSNBCContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(attrs={"class": re.compile("headline|content")})
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "msnbc.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
         print(self.soup)
 
     def scrape_title(self):
@@ -256,15 +406,17 @@ class ScrapeMSNBCContent(BaseWebscrapeContent):
 
 
 class ScrapeNewYorkPostContent(BaseWebscrapeContent, BaseGetResults):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(attrs={"class": re.compile("headline|single__content")})
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "nypost.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self.soup.find("h1", class_="headline headline--single-fallback").text
@@ -279,44 +431,37 @@ class ScrapeNewYorkPostContent(BaseWebscrapeContent, BaseGetResults):
         self._site_content = " ".join(tags_list)
 
 
-    def get_search_results(self, query, max_results=1000):
-        page = 1
-        links = []
-
-        while True:
-
-            page += 1
-            endpoint = f"https://nypost.com/search/{_htmlify_query(query)}/page/{page}/?orderby=relevance"
-            self.make_soup(endpoint)
-            tags = self.soup.find_all("a", {"class": re.compile("postid.*")})
-
-            if len(tags) == 0:
-                break
-
-            for tag in tags:
-                try:
-                    links.append(tag["href"])
-                except KeyError:
-                    continue
-
-            links = list(set(links))
-            if len(links) >= max_results:
-                break
-
-        if len(links) > max_results:
-            return links[:max_results]
+    @staticmethod
+    def _search_page_links(soup):
+        tags = soup.find_all("a", {"class": re.compile("postid.*")})
+        if len(tags) == 0:
+            return None
+        return [tag["href"] for tag in tags if tag.has_attr("href")]
+
+    def get_search_results(self, query, max_results=1000, checkpoint: CheckpointJournal=None):
+        query = _htmlify_query(query)
+        links, self._soup = _paginate_search(
+            lambda page: f"https://nypost.com/search/{query}/page/{page}/?orderby=relevance",
+            self._search_page_links,
+            max_results,
+            first_page=2,
+            session=self._session,
+            checkpoint=checkpoint)
+        return links
 
 
 class ScrapeMotherJonesContent(BaseWebscrapeContent, BaseGetResults):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(["h1", "article"])
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "motherjones.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
         print(self.soup.prettify())
 
     def scrape_title(self):
@@ -327,47 +472,35 @@ class ScrapeMotherJonesContent(BaseWebscrapeContent, BaseGetResults):
         paragraph_tags = [tag.text for tag in body.find_all("p")]
         self._site_content = " ".join(paragraph_tags)
 
-    def get_search_results(self, query, max_results=1000):
-        page = 1
-        links = []
-
-        while True:
-
-            page += 1
-            endpoint = f"https://www.motherjones.com/page/{page}/?s={_htmlify_query(query)}"
-            self.make_soup(endpoint)
-            headers = self.soup.find_all("h3", {"class": re.compile(".*hed.*")})
-            tags = []
-            for header in headers:
-                tags.append(header.find("a"))
-
-            if len(tags) == 0:
-                break
-
-            for tag in tags:
-                try:
-                    links.append(tag["href"])
-                except KeyError:
-                    continue
-
-            links = list(set(links))
-            if len(links) >= max_results:
-                break
-
-        if len(links) > max_results:
-            return links[:max_results]
+    @staticmethod
+    def _search_page_links(soup):
+        headers = soup.find_all("h3", {"class": re.compile(".*hed.*")})
+        if len(headers) == 0:
+            return None
+        tags = [header.find("a") for header in headers]
+        return [tag["href"] for tag in tags if tag is not None and tag.has_attr("href")]
+
+    def get_search_results(self, query, max_results=1000, checkpoint: CheckpointJournal=None):
+        query = _htmlify_query(query)
+        links, self._soup = _paginate_search(lambda page: f"https://www.motherjones.com/page/{page}/?s={query}",
+                                             self._search_page_links,
+                                             max_results,
+                                             first_page=2,
+                                             session=self._session,
+                                             checkpoint=checkpoint)
+        return links
 
 
 class ScrapeCenterSquareContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "thecentersquare.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self.soup.find("h1", {"class": re.compile(".*headline.*")}).text
@@ -380,15 +513,17 @@ class ScrapeCenterSquareContent(BaseWebscrapeContent):
 
 
 class ScrapeDispatchContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(["h1", "section"])
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "thedispatch.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self.soup.find("h1", {"class": re.compile(".*h1.*")}).text
@@ -401,15 +536,17 @@ class ScrapeDispatchContent(BaseWebscrapeContent):
 
 
 class ScrapeOANNContent(BaseWebscrapeContent, BaseGetResults):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(["h1", "article"])
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "oann.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self.soup.find("h1", {"class": re.compile(".*title.*")}).text
@@ -419,43 +556,37 @@ class ScrapeOANNContent(BaseWebscrapeContent, BaseGetResults):
         paragraph_tags = [tag.text for tag in body.find_all("p")]
         self._site_content = " ".join(paragraph_tags)
 
-    def get_search_results(self, query, max_results=1000):
-        links = []
-        page = 0
-
-        while True:
-            page += 1
-            query = _htmlify_query(query)
-            endpoint = f"https://www.oann.com/page/{page}/?s={query}"
-            self.make_soup(endpoint)
-            entries = self.soup.find_all("h2", class_="entry-title")
-
-            for entry in entries:
-                try:
-                    tag = entry.find("a")
-                    links.append(tag["href"])
-                except KeyError:
-                    continue
-
-            if len(entries) == 0:
-                break
-            elif len(links) > max_results:
-                links = links[:max_results]
-                break
-
+    @staticmethod
+    def _search_page_links(soup):
+        entries = soup.find_all("h2", class_="entry-title")
+        if len(entries) == 0:
+            return None
+        tags = [entry.find("a") for entry in entries]
+        return [tag["href"] for tag in tags if tag is not None and tag.has_attr("href")]
+
+    def get_search_results(self, query, max_results=1000, checkpoint: CheckpointJournal=None):
+        query = _htmlify_query(query)
+        links, self._soup = _paginate_search(lambda page: f"https://www.oann.com/page/{page}/?s={query}",
+                                             self._search_page_links,
+                                             max_results,
+                                             first_page=1,
+                                             session=self._session,
+                                             checkpoint=checkpoint)
         return links
 
 
 class ScrapeABCContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(["h1", "p"])
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "abcnews.go.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         self._title = self.soup.find("h1", {
@@ -471,15 +602,15 @@ class ScrapeABCContent(BaseWebscrapeContent):
 
 
 class ScrapeUSATodayContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -489,15 +620,15 @@ class ScrapeUSATodayContent(BaseWebscrapeContent):
 
 
 class ScrapeCNBCContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -507,15 +638,15 @@ class ScrapeCNBCContent(BaseWebscrapeContent):
 
 
 class ScrapeNationalReviewContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -525,15 +656,15 @@ class ScrapeNationalReviewContent(BaseWebscrapeContent):
 
 
 class ScrapeFederalistContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -543,15 +674,15 @@ class ScrapeFederalistContent(BaseWebscrapeContent):
 
 
 class ScrapeReasonContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -561,15 +692,15 @@ class ScrapeReasonContent(BaseWebscrapeContent):
 
 
 class ScrapeWashingtonExaminerContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -579,15 +710,15 @@ class ScrapeWashingtonExaminerContent(BaseWebscrapeContent):
 
 
 class ScrapeRealClearPoliticsContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -597,15 +728,15 @@ class ScrapeRealClearPoliticsContent(BaseWebscrapeContent):
 
 
 class ScrapeVoxContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -615,15 +746,15 @@ class ScrapeVoxContent(BaseWebscrapeContent):
 
 
 class ScrapeSlateContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -633,15 +764,15 @@ class ScrapeSlateContent(BaseWebscrapeContent):
 
 
 class ScrapeTheNationContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -651,15 +782,15 @@ class ScrapeTheNationContent(BaseWebscrapeContent):
 
 
 class ScrapeDailyWireContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -669,15 +800,15 @@ class ScrapeDailyWireContent(BaseWebscrapeContent):
 
 
 class ScrapeHuffingtonPostContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -687,15 +818,15 @@ class ScrapeHuffingtonPostContent(BaseWebscrapeContent):
 
 
 class ScrapeInterceptContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -705,15 +836,15 @@ class ScrapeInterceptContent(BaseWebscrapeContent):
 
 
 class ScrapeWesternJournalContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -723,15 +854,15 @@ class ScrapeWesternJournalContent(BaseWebscrapeContent):
 
 
 class ScrapeDailyKosContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -741,15 +872,15 @@ class ScrapeDailyKosContent(BaseWebscrapeContent):
 
 
 class ScrapeForbesContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
 
     def scrape_title(self):
         pass
@@ -758,15 +889,17 @@ class ScrapeForbesContent(BaseWebscrapeContent):
         pass
 
 class ScrapeFoxContent(BaseWebscrapeContent, BaseGetResults):
-    def __init__(self):
-        super().__init__()
+    parse_only = SoupStrainer(attrs={"class": re.compile("headline|article-body")})
+
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return "foxnews.com"
 
     def make_soup(self, url: str):
-        self._soup = _html_soup(url)
+        self._soup = _html_soup(url, session=self._session, parse_only=self.parse_only)
         with open("test.html", "w") as f:
             f.write(self.soup.prettify())
 
@@ -783,36 +916,67 @@ class ScrapeFoxContent(BaseWebscrapeContent, BaseGetResults):
 
         self._site_content = " ".join(tag_list)
 
-    def get_search_results(self, query, max_results=1000):
+    def get_search_results(self, query, max_results=1000, pool: BrowserPool=None, scheduler: DomainScheduler=None,
+                           render_timeout: float=10):
+        """Click "load more" until max_results links are shown, then collect them.
+
+        Args:
+            query (str): Search query
+            max_results (int, optional): Maximum links to return. None for no limit
+            pool (BrowserPool, optional): Browser pool. Defaults to a shared Chrome pool
+            scheduler (DomainScheduler, optional): Throttles the page load and every click
+            render_timeout (float): Seconds to wait for a click to render new results. Loading stops once a click
+                renders nothing within this time
+
+        Returns:
+            List[str]: Article links
+        """
         num_results = 0
         links = []
 
-        endpoint = f"https://www.foxnews.com/search-results/search#q={query.replace(" ", "%20")}"
-        driver = webdriver.Chrome()
-        driver.get(endpoint)
-
-        # Adapted from
-        button = driver.find_element(By.XPATH, "/html/body/div/div/div/div[2]/div[2]/div/div[3]/div[2]")
-        interaction_failed_once = False
-        while True:
-            # Click then wait to load page
-            try:
-                button.click()
-                num_results += 10
-                if max_results is not None and num_results >= max_results:
-                    break
-            except ElementNotInteractableException:
-                if not interaction_failed_once:
+        endpoint = f"https://www.foxnews.com/search-results/search#q={query.replace(' ', '%20')}"
+        button_xpath = "/html/body/div/div/div/div[2]/div[2]/div/div[3]/div[2]"
+        if pool is None:
+            pool = get_default_browser_pool("chrome")
+        if scheduler is None:
+            scheduler = get_default_scheduler()
+        result_locator = (By.CSS_SELECTOR, "h2.title")
+
+        with pool.driver() as driver:
+            scheduler.acquire(endpoint, self._session.fetch_robots)
+            driver.get(endpoint)
+            wait_for_element(By.XPATH, button_xpath)(driver)
+
+            # Adapted from
+            button = driver.find_element(By.XPATH, button_xpath)
+            interaction_failed_once = False
+            while True:
+                shown = len(driver.find_elements(*result_locator))
+                # Each click loads another page of results, so it is throttled like a request
+                scheduler.acquire(endpoint)
+                try:
+                    button.click()
+                    num_results += 10
+                    if max_results is not None and num_results >= max_results:
+                        break
+                except ElementNotInteractableException:
+                    if interaction_failed_once:
+                        break
                     interaction_failed_once = True
-                else:
-                    break
+                    try:
+                        WebDriverWait(driver, render_timeout).until(ec.element_to_be_clickable(button))
+                    except TimeoutException:
+                        pass
+                    continue
 
-            time.sleep(1)
+                # Continue as soon as the click's results render, rather than after a fixed delay
+                wait_for_element_count(*result_locator, shown + 1, render_timeout)(driver)
+                if len(driver.find_elements(*result_locator)) <= shown:
+                    break
 
-        content = driver.page_source
-        driver.close()
+            content = driver.page_source
 
-        self._soup = BeautifulSoup(content, "html.parser")
+        self._soup = _parse_html(content)
         titles = self.soup.find_all("h2", class_="title")
         for title in titles:
             try:
@@ -827,15 +991,15 @@ class ScrapeFoxContent(BaseWebscrapeContent, BaseGetResults):
 
 
 class ScrapeReutersContent(BaseWebscrapeContent):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, session: HttpSession=None):
+        super().__init__(session)
 
     @staticmethod
     def get_domain():
         return ""
 
     def make_soup(self, url: str):
-        self._soup = selenium_soup(url)
+        self._soup = selenium_soup(url, parse_only=self.parse_only)
         print(self.soup)
 
     def scrape_title(self):
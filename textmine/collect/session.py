@@ -0,0 +1,228 @@
+import threading
+from typing import Any, Dict, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cache import ResponseCache
+from .throttle import THROTTLE_STATUS_CODES, DomainScheduler, get_default_scheduler
+
+
+class HttpSession:
+    """Pooled, keep-alive HTTP session shared by scrapers and API clients.
+
+    Wraps a ``requests.Session`` mounted with a single ``HTTPAdapter`` so every
+    host gets its own connection pool and TCP/TLS connections are reused across
+    requests instead of being re-established on every call. Every request
+    that reaches the network first waits on a :class:`DomainScheduler`. An
+    optional :class:`ResponseCache` serves repeated requests from disk.
+
+    Attributes:
+        _session (Session): Underlying requests session
+        _adapter (HTTPAdapter): Adapter holding the per-host connection pools
+        _timeout: Default (connect, read) timeout applied to every request
+        _cache (ResponseCache): On-disk response cache, or None
+        _scheduler (DomainScheduler): Per-domain rate limiter
+    """
+
+    def __init__(self,
+                 pool_connections: int = 16,
+                 pool_maxsize: int = 16,
+                 timeout: Union[float, Tuple[float, float]] = (10, 30),
+                 retries: int = 3,
+                 backoff_factor: float = 0.5,
+                 status_forcelist: Tuple[int, ...] = (500, 502, 504),
+                 headers: Optional[Dict[str, str]] = None,
+                 cache: Optional[ResponseCache] = None,
+                 scheduler: Optional[DomainScheduler] = None,
+                 throttle_retries: int = 2):
+        """Initialize the session.
+
+        Args:
+            pool_connections (int): Number of per-host pools to keep alive
+            pool_maxsize (int): Maximum connections kept open per host
+            timeout (float | tuple): Default (connect, read) timeout in seconds
+            retries (int): Retries for connection errors and retryable statuses
+            backoff_factor (float): Exponential backoff factor between retries
+            status_forcelist (tuple): Status codes that trigger a retry
+            headers (dict, optional): Headers sent with every request
+            cache (ResponseCache, optional): On-disk cache consulted before
+                the network
+            scheduler (DomainScheduler, optional): Per-domain rate limiter.
+                Defaults to the process-wide scheduler so every session shares
+                one budget per domain. Pass ``DomainScheduler(rate=None)`` to
+                disable rate limiting
+            throttle_retries (int): Retries after a 429/503 response, each made
+                once the scheduler's back-off has elapsed
+        """
+        self._timeout = timeout
+        self._cache = cache
+        self._scheduler = scheduler if scheduler is not None else get_default_scheduler()
+        self._throttle_retries = throttle_retries
+        self._lock = threading.Lock()
+        self._requests_sent = 0
+        self._cache_hits = 0
+        self._cache_revalidated = 0
+
+        retry = Retry(total=retries,
+                      backoff_factor=backoff_factor,
+                      status_forcelist=status_forcelist,
+                      allowed_methods=frozenset(["GET", "HEAD"]),
+                      respect_retry_after_header=True,
+                      raise_on_status=False)
+        self._adapter = HTTPAdapter(pool_connections=pool_connections,
+                                    pool_maxsize=pool_maxsize,
+                                    max_retries=retry)
+
+        self._session = requests.Session()
+        self._session.mount("http://", self._adapter)
+        self._session.mount("https://", self._adapter)
+        if headers:
+            self._session.headers.update(headers)
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None,
+            timeout: Union[float, Tuple[float, float], None] = None) -> requests.Response:
+        """Send a GET request over a pooled connection.
+
+        With a cache attached, fresh entries are returned without a request and
+        stale entries are revalidated with ``If-None-Match``/``If-Modified-Since``.
+
+        Args:
+            url (str): URL to request
+            params (dict, optional): Query string parameters
+            headers (dict, optional): Extra headers for this request only
+            timeout (float | tuple, optional): Overrides the default timeout
+
+        Returns:
+            Response: The response object
+        """
+        key = entry = None
+        if self._cache is not None:
+            key = self._cache.key(url, params)
+            entry = self._cache.lookup(key)
+            if entry is not None:
+                if self._cache.is_fresh(entry):
+                    cached = self._cache.to_response(entry)
+                    if cached is not None:
+                        with self._lock:
+                            self._cache_hits += 1
+                        return cached
+                headers = {**(headers or {}), **self._cache.conditional_headers(entry)}
+
+        for _ in range(self._throttle_retries + 1):
+            self._scheduler.acquire(url, self.fetch_robots)
+            response = self._session.get(url,
+                                         params=params,
+                                         headers=headers,
+                                         timeout=timeout if timeout is not None else self._timeout)
+            with self._lock:
+                self._requests_sent += 1
+            self._scheduler.feedback(url, response.status_code, response.headers)
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                break
+
+        if self._cache is not None:
+            if response.status_code == 304 and entry is not None:
+                cached = self._cache.to_response(entry)
+                if cached is not None:
+                    self._cache.refresh(key, entry)
+                    with self._lock:
+                        self._cache_revalidated += 1
+                    return cached
+            elif response.status_code == 200:
+                self._cache.store(key, response)
+        return response
+
+    def fetch_robots(self, url: str) -> Optional[str]:
+        """Fetch a robots.txt file, bypassing the scheduler and cache.
+
+        Args:
+            url (str): robots.txt URL
+
+        Returns:
+            str: File contents, an empty string if there is none, or None on
+            connection errors
+        """
+        try:
+            response = self._session.get(url, timeout=self._timeout)
+        except requests.RequestException:
+            return None
+        return response.text if response.status_code == 200 else ""
+
+    def stats(self) -> Dict[str, int]:
+        """Report connection reuse counters.
+
+        Counts are read from the live per-host pools, so hosts whose pool was
+        evicted (more hosts than ``pool_connections``) are no longer included.
+
+        Returns:
+            dict: ``requests``, ``hosts``, ``connections_opened``,
+            ``connections_reused``, ``cache_hits`` and ``cache_revalidated``
+        """
+        pools = self._adapter.poolmanager.pools
+        hosts = 0
+        opened = 0
+        pooled_requests = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            hosts += 1
+            opened += pool.num_connections
+            pooled_requests += pool.num_requests
+
+        return {
+            "requests": self._requests_sent,
+            "hosts": hosts,
+            "connections_opened": opened,
+            "connections_reused": max(pooled_requests - opened, 0),
+            "cache_hits": self._cache_hits,
+            "cache_revalidated": self._cache_revalidated
+        }
+
+    @property
+    def cache(self) -> Optional[ResponseCache]:
+        return self._cache
+
+    @property
+    def scheduler(self) -> DomainScheduler:
+        return self._scheduler
+
+    def close(self):
+        """Close every pooled connection."""
+        self._session.close()
+
+    def __enter__(self) -> 'HttpSession':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+_default_session: Optional[HttpSession] = None
+_default_lock = threading.Lock()
+
+
+def get_default_session() -> HttpSession:
+    """Get the process-wide session, creating it on first use.
+
+    Returns:
+        HttpSession: Shared session used when no session is passed explicitly
+    """
+    global _default_session
+    with _default_lock:
+        if _default_session is None:
+            _default_session = HttpSession()
+        return _default_session
+
+
+def set_default_session(session: HttpSession):
+    """Replace the process-wide session.
+
+    Args:
+        session (HttpSession): Session to use when none is passed explicitly
+    """
+    global _default_session
+    with _default_lock:
+        _default_session = session
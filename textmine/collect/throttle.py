@@ -0,0 +1,257 @@
+import os
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Mapping, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+
+
+# Status codes a server uses to ask us to slow down
+THROTTLE_STATUS_CODES = (429, 503)
+
+# Rates for API hosts, which meter usage by quota rather than by crawl politeness
+API_DOMAIN_RATES = {
+    "www.googleapis.com": 20.0,
+    "newsapi.org": 5.0,
+    "api.nytimes.com": 5.0 / 60
+}
+
+
+def _domain(url: str) -> str:
+    return urlparse(url).netloc.lower()
+
+
+def _retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class _DomainState:
+    def __init__(self, rate: Optional[float], burst: int):
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.robots_loaded = False
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token, returning how long the caller must wait for it."""
+        now = time.monotonic()
+        wait = max(self.blocked_until - now, 0.0)
+        if self.rate is None:
+            return wait
+
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        self.tokens -= 1
+        if self.tokens < 0:
+            wait = max(wait, -self.tokens / self.rate)
+        return wait
+
+
+class DomainScheduler:
+    """Per-domain politeness scheduler shared by every fetch path.
+
+    Each domain gets a token bucket refilled at ``rate`` requests per second
+    with room for ``burst`` back-to-back requests. A ``Crawl-delay`` or
+    ``Request-rate`` in the domain's robots.txt lowers that rate. When a
+    server answers 429 or 503 the domain's rate is halved and ``Retry-After``
+    is honoured. Each later success restores the rate a little at a time.
+
+    Attributes:
+        rate (float): Default requests per second per domain. None disables
+            throttling except for robots.txt and 429/503 back-off
+        burst (int): Default bucket capacity
+    """
+
+    def __init__(self,
+                 rate: Optional[float] = 2.0,
+                 burst: int = 4,
+                 domain_rates: Optional[Mapping[str, float]] = None,
+                 respect_robots: bool = True,
+                 robots_cache_dir: Optional[str] = None,
+                 robots_ttl: float = 24 * 60 * 60,
+                 user_agent: str = "*",
+                 min_rate: float = 0.05,
+                 recovery: float = 1.1):
+        """Initialize the scheduler.
+
+        Args:
+            rate (float, optional): Default requests per second per domain
+            burst (int): Default bucket capacity
+            domain_rates (Mapping[str, float], optional): Per-domain rate overrides
+            respect_robots (bool): Apply robots.txt crawl delays
+            robots_cache_dir (str, optional): Directory where robots.txt files
+                are cached between runs
+            robots_ttl (float): Seconds a cached robots.txt stays valid
+            user_agent (str): User agent whose robots.txt rules apply
+            min_rate (float): Floor for the adaptive back-off, in requests per second
+            recovery (float): Rate multiplier applied after each success while
+                backed off
+        """
+        self.rate = rate
+        self.burst = burst
+        self._domain_rates = {k.lower(): v for k, v in (domain_rates or {}).items()}
+        self._respect_robots = respect_robots
+        self._robots_cache_dir = robots_cache_dir
+        self._robots_ttl = robots_ttl
+        self._user_agent = user_agent
+        self._min_rate = min_rate
+        self._recovery = recovery
+        self._domains: Dict[str, _DomainState] = {}
+        self._lock = threading.Lock()
+
+        if robots_cache_dir:
+            os.makedirs(robots_cache_dir, exist_ok=True)
+
+    def _state(self, domain: str) -> _DomainState:
+        with self._lock:
+            state = self._domains.get(domain)
+            if state is None:
+                state = _DomainState(self._domain_rates.get(domain, self.rate), self.burst)
+                self._domains[domain] = state
+            return state
+
+    def _robots_text(self, url: str, domain: str, fetch_robots: Optional[Callable[[str], Optional[str]]]):
+        cache_path = None
+        if self._robots_cache_dir:
+            cache_path = os.path.join(self._robots_cache_dir, domain.replace(":", "_") + ".txt")
+            try:
+                if time.time() - os.path.getmtime(cache_path) < self._robots_ttl:
+                    with open(cache_path, "r") as f:
+                        return f.read()
+            except FileNotFoundError:
+                pass
+
+        if fetch_robots is None:
+            return None
+
+        parsed = urlparse(url)
+        text = fetch_robots(f"{parsed.scheme or 'https'}://{parsed.netloc}/robots.txt")
+        if text is not None and cache_path is not None:
+            with open(cache_path, "w") as f:
+                f.write(text)
+        return text
+
+    def _load_robots(self, url: str, domain: str, state: _DomainState,
+                     fetch_robots: Optional[Callable[[str], Optional[str]]]):
+        try:
+            text = self._robots_text(url, domain, fetch_robots)
+        except Exception:
+            text = None
+        if not text:
+            return
+
+        robots = RobotFileParser()
+        robots.parse(text.splitlines())
+        delay = robots.crawl_delay(self._user_agent)
+        request_rate = robots.request_rate(self._user_agent)
+
+        robots_rate = None
+        if delay:
+            robots_rate = 1.0 / float(delay)
+        if request_rate and request_rate.seconds:
+            rate = request_rate.requests / request_rate.seconds
+            robots_rate = rate if robots_rate is None else min(robots_rate, rate)
+
+        if robots_rate is not None and (state.base_rate is None or robots_rate < state.base_rate):
+            state.base_rate = robots_rate
+            state.rate = robots_rate if state.rate is None else min(state.rate, robots_rate)
+            state.burst = 1
+            state.tokens = min(state.tokens, 1.0)
+
+    def acquire(self, url: str, fetch_robots: Optional[Callable[[str], Optional[str]]] = None):
+        """Block until a request to the URL's domain is allowed.
+
+        Args:
+            url (str): URL about to be requested
+            fetch_robots (Callable, optional): Fetches a robots.txt URL and
+                returns its text, or None. Called at most once per domain, and
+                only when no cached copy is available
+        """
+        domain = _domain(url)
+        state = self._state(domain)
+        with state.lock:
+            if self._respect_robots and not state.robots_loaded:
+                state.robots_loaded = True
+                self._load_robots(url, domain, state, fetch_robots)
+            wait = state.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    def feedback(self, url: str, status_code: int, headers: Optional[Mapping[str, str]] = None):
+        """Adapt a domain's rate to the response it returned.
+
+        Args:
+            url (str): URL that was requested
+            status_code (int): Response status code
+            headers (Mapping[str, str], optional): Response headers
+        """
+        state = self._state(_domain(url))
+        with state.lock:
+            if status_code in THROTTLE_STATUS_CODES:
+                current = state.rate if state.rate is not None else float(state.burst)
+                state.rate = max(current / 2.0, self._min_rate)
+                state.tokens = min(state.tokens, 0.0)
+                state.updated = time.monotonic()
+                retry_after = _retry_after_seconds((headers or {}).get("Retry-After"))
+                pause = retry_after if retry_after is not None else 1.0 / state.rate
+                state.blocked_until = max(state.blocked_until, time.monotonic() + pause)
+            elif state.rate is not None and (state.base_rate is None or state.rate < state.base_rate):
+                state.rate = state.rate * self._recovery
+                if state.base_rate is not None and state.rate >= state.base_rate:
+                    state.rate = state.base_rate
+                elif state.base_rate is None and state.rate >= float(state.burst):
+                    state.rate = None
+
+    def domain_rate(self, url_or_domain: str) -> Optional[float]:
+        """Get the current rate for a domain.
+
+        Args:
+            url_or_domain (str): URL or bare domain
+
+        Returns:
+            float: Requests per second, or None if unthrottled
+        """
+        domain = _domain(url_or_domain) if "//" in url_or_domain else url_or_domain.lower()
+        return self._state(domain).rate
+
+
+_default_scheduler: Optional[DomainScheduler] = None
+_default_lock = threading.Lock()
+
+
+def get_default_scheduler() -> DomainScheduler:
+    """Get the process-wide scheduler, creating it on first use.
+
+    Returns:
+        DomainScheduler: Scheduler shared by every session and browser pool
+    """
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            _default_scheduler = DomainScheduler(domain_rates=API_DOMAIN_RATES)
+        return _default_scheduler
+
+
+def set_default_scheduler(scheduler: DomainScheduler):
+    """Replace the process-wide scheduler.
+
+    Args:
+        scheduler (DomainScheduler): Scheduler to use when none is passed explicitly
+    """
+    global _default_scheduler
+    with _default_lock:
+        _default_scheduler = scheduler
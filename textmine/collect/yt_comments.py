@@ -1,14 +1,21 @@
+import asyncio
 import csv
+import threading
 import time
 import warnings
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import argparse
 import re
 import json
-import requests
 import numpy as np
 
+from textmine.collect.session import HttpSession, get_default_session
+from textmine.utils import corpus_store
+from textmine.utils.checkpoint import CheckpointJournal
+from textmine.utils.dedup import CommentDedup
+
 
 def scrape_youtube_comments(api_key_file,
                             video_url=None,
@@ -17,7 +24,13 @@ def scrape_youtube_comments(api_key_file,
                             author=None,
                             save_dir="./",
                             max_comments=100,
-                            ids_passed=False):
+                            ids_passed=False,
+                            session: HttpSession=None,
+                            concurrency=1,
+                            quota_budget=None,
+                            dedup_dir=None,
+                            checkpoint=None,
+                            output_format="csv"):
     """
 
     :param api_key_file:
@@ -28,6 +41,17 @@ def scrape_youtube_comments(api_key_file,
     :param save_dir:
     :param max_comments:
     :param ids_passed:
+    :param session: Pooled HttpSession reused for every API page. Defaults to the shared session.
+    :param concurrency: Number of videos scraped at the same time. Each video's CSV is written as soon as it finishes.
+    :param quota_budget: Maximum API quota units to spend across all videos, or a shared QuotaBudget. None for no limit.
+    :param dedup_dir: Directory where the IDs and text hashes of saved comments are kept per video. When set, a video
+        that was scraped before only yields comments that were not saved by an earlier run.
+    :param checkpoint: Path of a CheckpointJournal. Every page is journaled as it arrives, finished videos are
+        skipped on the next run and unfinished ones continue from their last page token. A video's CSV is only written
+        once it is complete.
+    :param output_format: "csv" writes one comment per row with commas removed. "corpus" writes a columnar corpus
+        file (see textmine.utils.corpus_store) that keeps the text unaltered along with comment IDs, the video ID and
+        publish times.
     :return:
     """
     # Argument checks
@@ -38,6 +62,16 @@ def scrape_youtube_comments(api_key_file,
         warnings.warn("Both video and source_csv were passed. Defaulting to video")
         source_csv = None
 
+    if output_format not in ("csv", "corpus"):
+        raise ValueError(f"Unsupported output format '{output_format}'. Expected 'csv' or 'corpus'.")
+    if session is None:
+        session = get_default_session()
+    if quota_budget is not None and not isinstance(quota_budget, QuotaBudget):
+        quota_budget = QuotaBudget(int(quota_budget))
+    if dedup_dir:
+        os.makedirs(dedup_dir, exist_ok=True)
+    journal = CheckpointJournal(checkpoint) if checkpoint else None
+
     # Read api key
     with open(api_key_file, "r") as f:
         api_key = f.read()
@@ -67,62 +101,182 @@ def scrape_youtube_comments(api_key_file,
                 video_ids[i] = re.search(r"v=[^&]*", url).group()[2:]
 
     # Zip up all song metadata and iterate
-    video_data = zip(video_ids, titles, authors)
-    for i, (video_id, song, author) in enumerate(video_data):
-        # Set number of comments left to read
-        comments_remaining = max_comments
-        comments = []
-
-        # Set request parameters
-        params = {
-            "part": "snippet",
-            "key": api_key,
-            "videoId": video_id,
-            "maxResults": 100 if comments_remaining > 100 else comments_remaining
-        }
-
-        while comments_remaining != 0:
-            # Make request
-            endpoint = "https://www.googleapis.com/youtube/v3/commentThreads"
-            response = requests.get(endpoint, params=params)
-
-            # Check for non-passing status code
-            if response.status_code != 200:
-                print(response.reason)
-                break
+    video_data = list(zip(video_ids, titles, authors))
+    try:
+        if concurrency > 1:
+            asyncio.run(_scrape_videos_concurrently(video_data, api_key, save_dir, max_comments, session,
+                                                    concurrency, quota_budget, dedup_dir, journal, output_format))
+            return
 
-            # Process json data
-            raw_data = response.json()
-            comment_list = raw_data["items"]
-            for comment_data in comment_list:
-                comments.append(comment_data["snippet"]["topLevelComment"]["snippet"]["textOriginal"].replace(",", ""))
+        for video_id, song, author in video_data:
+            _scrape_and_save_video(video_id, song, author, api_key, save_dir, max_comments, session, quota_budget,
+                                   dedup_dir, journal, output_format)
+    finally:
+        if journal is not None:
+            journal.close()
 
-            comments = list(set(comments))
-            comments_remaining = max_comments - len(comments)
-            params["maxResults"] = 100 if comments_remaining > 100 else comments_remaining
-            print(f"Status: {np.round(100 * len(comments) / max_comments, 2)}%")
 
-            try:
-                params["pageToken"] = raw_data["nextPageToken"]
-            except KeyError:
-                print("No next page. Stopping early.")
+class QuotaBudget:
+    """Thread-safe YouTube Data API quota budget shared by concurrent workers.
+
+    Each ``commentThreads.list`` call costs one unit.
+    """
+
+    def __init__(self, units: int):
+        self._remaining = units
+        self._lock = threading.Lock()
+
+    def spend(self, units: int=1) -> bool:
+        """Reserve quota units. Returns False once the budget is exhausted."""
+        with self._lock:
+            if self._remaining < units:
+                return False
+            self._remaining -= units
+            return True
+
+    @property
+    def remaining(self) -> int:
+        return self._remaining
+
+
+def _fetch_video_comments(video_id, api_key, max_comments, session, dedup, quota_budget=None, journal=None,
+                          strip_commas=True):
+    """
+    :return: The unique comments as (comment ID, text, publish time) tuples, and whether the video was read to the end
+        (False if stopped by an API error or the quota budget).
+    """
+    records = []
+    # Set request parameters
+    params = {
+        "part": "snippet",
+        "key": api_key,
+        "videoId": video_id
+    }
+
+    # Pick up where an interrupted run stopped
+    if journal is not None:
+        resumed = journal.resume(video_id)
+        if resumed is not None:
+            next_token, items = resumed
+            for item in items:
+                comment_id, text = item[0], item[1]
+                if dedup.add(comment_id or None, text):
+                    records.append((comment_id or None, text, item[2] if len(item) > 2 else None))
+            if next_token is None:
+                return records, True
+            params["pageToken"] = next_token
+
+    # Set number of comments left to read
+    comments_remaining = max_comments - len(dedup)
+    params["maxResults"] = 100 if comments_remaining > 100 else comments_remaining
+
+    while comments_remaining > 0:
+        if quota_budget is not None and not quota_budget.spend():
+            print("Quota budget exhausted. Stopping early.")
+            return records, False
+
+        # Make request
+        endpoint = "https://www.googleapis.com/youtube/v3/commentThreads"
+        response = session.get(endpoint, params=params)
+
+        # Check for non-passing status code
+        if response.status_code != 200:
+            print(response.reason)
+            return records, False
+
+        # Process json data
+        raw_data = response.json()
+        comment_list = raw_data["items"]
+        page_items = []
+        for comment_data in comment_list:
+            if len(dedup) >= max_comments:
                 break
+            comment_id = comment_data.get("id")
+            snippet = comment_data["snippet"]["topLevelComment"]["snippet"]
+            text = snippet["textOriginal"]
+            if strip_commas:
+                text = text.replace(",", "")
+            published_at = snippet.get("publishedAt")
+            if dedup.add(comment_id, text):
+                records.append((comment_id, text, published_at))
+                page_items.append([comment_id, text, published_at])
+
+        next_token = raw_data.get("nextPageToken")
+        if journal is not None:
+            journal.record_page(video_id, next_token, page_items)
+
+        comments_remaining = max_comments - len(dedup)
+        params["maxResults"] = 100 if comments_remaining > 100 else comments_remaining
+        print(f"Status: {np.round(100 * len(dedup) / max_comments, 2)}%")
+
+        if next_token is None:
+            print("No next page. Stopping early.")
+            break
+        params["pageToken"] = next_token
+
+    return records, True
+
+
+def _save_video_comments(records, save_dir, song, author, video_id, output_format="csv"):
+    save_path = os.path.join(save_dir,
+        f"{len(records)}"
+        f"{('_' + song.lower().replace(' ', '-')) if song else ''}"
+        f"{('_' + author.lower().replace(' ', '-')) if author else ''}"
+        f"_{video_id}")
 
-        if len(comments) == 0:
-            continue
+    if output_format == "corpus":
+        with corpus_store.CorpusWriter(save_path + corpus_store.CORPUS_EXTENSION) as writer:
+            for comment_id, text, published_at in records:
+                writer.write(text, comment_id, video_id, published_at)
+        return
 
-        comments = list(set(comments))
-        comments = [[comment] for comment in comments]
+    comments = [[text] for _, text, _ in records]
+    with open(save_path + ".csv", "w") as f:
+        writer = csv.writer(f, delimiter=",")
+        writer.writerows(comments)
 
-        save_path = os.path.join(save_dir,
-            f"{len(comments)}"
-            f"{('_' + song.lower().replace(' ', '-')) if song else ''}"
-            f"{('_' + author.lower().replace(' ', '-')) if author else ''}"
-            f"_{video_id}.csv")
 
-        with open(save_path, "w") as f:
-            writer = csv.writer(f, delimiter=",")
-            writer.writerows(comments)
+def _scrape_and_save_video(video_id, song, author, api_key, save_dir, max_comments, session, quota_budget=None,
+                           dedup_dir=None, journal=None, output_format="csv"):
+    if journal is not None and journal.is_done(video_id):
+        print(f"Video {video_id} already collected. Skipping.")
+        return
+
+    dedup = CommentDedup(os.path.join(dedup_dir, f"{video_id}.seen") if dedup_dir else None)
+    comments, complete = _fetch_video_comments(video_id, api_key, max_comments, session, dedup, quota_budget,
+                                               journal, output_format == "csv")
+    if journal is not None and not complete:
+        # Partial results stay in the journal and are completed by the next run
+        print(f"Video {video_id} interrupted after {len(comments)} comments. Rerun to resume.")
+        return
+
+    if len(comments) > 0:
+        _save_video_comments(comments, save_dir, song, author, video_id, output_format)
+        # Only remember comments once they are safely on disk
+        dedup.save()
+    if journal is not None:
+        journal.mark_done(video_id)
+
+
+async def _scrape_videos_concurrently(video_data, api_key, save_dir, max_comments, session, concurrency,
+                                      quota_budget=None, dedup_dir=None, journal=None, output_format="csv"):
+    """Scrape many videos at once, writing each video's CSV as soon as it completes."""
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+
+    async def run(executor, video_id, song, author):
+        async with limit:
+            if quota_budget is not None and quota_budget.remaining <= 0:
+                return
+            try:
+                await loop.run_in_executor(executor, _scrape_and_save_video, video_id, song, author, api_key,
+                                           save_dir, max_comments, session, quota_budget, dedup_dir, journal,
+                                           output_format)
+            except Exception as e:
+                print(f"Error scraping video {video_id}: {e}")
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        await asyncio.gather(*(run(executor, video_id, song, author) for video_id, song, author in video_data))
 
 
 if __name__ == "__main__":
@@ -153,6 +307,21 @@ if __name__ == "__main__":
                                                      "Default 100.")
     parser.add_argument("--ids", "-i", action="store_true", help="To pass video IDs instead of "
                                                                         "URLS, pass this argument.")
+    parser.add_argument("--concurrency", "-n", type=int, default=1,
+                        help="Number of videos from --source_csv (-C) to scrape at the same time. Default 1.")
+    parser.add_argument("--quota", "-q", type=int,
+                        help="Maximum YouTube API quota units to spend across all videos. One unit is spent per "
+                             "page of comments. Defaults to no limit.")
+    parser.add_argument("--dedup_dir", "-d",
+                        help="Directory where already-saved comments are remembered per video. When passed, "
+                             "re-scraping a video only saves comments that were not saved before.")
+    parser.add_argument("--checkpoint", "-k",
+                        help="Journal file used to resume an interrupted run. Finished videos are skipped and "
+                             "unfinished videos continue from the last page that was read.")
+
+    parser.add_argument("--output_format", "-o", choices=("csv", "corpus"), default="csv",
+                        help="Save comments as CSV (commas removed) or as a columnar corpus file that keeps the "
+                             "original text with comment IDs, video IDs and publish times. Default csv.")
 
     # Parse arguments
     args = parser.parse_args()
@@ -166,4 +335,9 @@ if __name__ == "__main__":
                             args.author,
                             args.save_dir if args.save_dir else "./",
                             int(args.max_comments) if args.max_comments else 100,
-                            args.ids)
+                            args.ids,
+                            concurrency=args.concurrency,
+                            quota_budget=args.quota,
+                            dedup_dir=args.dedup_dir,
+                            checkpoint=args.checkpoint,
+                            output_format=args.output_format)
@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+
+
+class CheckpointJournal:
+    """Append-only journal that lets interrupted collection runs resume.
+
+    Each collection unit (a video ID, a search query) is identified by a key.
+    After every page, the unit's next page token and that page's results are
+    appended as one JSON line and flushed to disk, so a crash loses at most the
+    page in flight. When the journal is reopened it is replayed, and the
+    partial results, next token and completed keys are restored. Completed
+    keys keep no results in memory, and the journal is compacted on open to
+    one line per key, so it does not grow with the pages of finished units.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Journal file. Created if missing, replayed if it exists.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._tokens = {}
+        self._items = {}
+        self._done = set()
+
+        replayed = 0
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                for line in f:
+                    replayed += 1
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Torn final line from a crash mid-write
+                        continue
+                    self._apply(record)
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if replayed > len(self._done) + len(self._tokens):
+            self._compact()
+        self._file = open(path, "a")
+
+    def _compact(self):
+        """Rewrite the journal with one record per key. The old journal is replaced atomically."""
+        tmp_path = self._path + ".tmp"
+        with open(tmp_path, "w") as f:
+            for key in self._done:
+                f.write(json.dumps({"key": key, "done": True}) + "\n")
+            for key, token in self._tokens.items():
+                f.write(json.dumps({"key": key, "token": token, "items": self._items.get(key, [])}) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self._path)
+
+    def _apply(self, record):
+        key = record["key"]
+        if record.get("done"):
+            self._done.add(key)
+            # Results of a finished unit are saved by the caller and never resumed
+            self._tokens.pop(key, None)
+            self._items.pop(key, None)
+        else:
+            self._tokens[key] = record.get("token")
+            self._items.setdefault(key, []).extend(record.get("items", []))
+
+    def _append(self, record):
+        with self._lock:
+            self._apply(record)
+            self._file.write(json.dumps(record) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def is_done(self, key) -> bool:
+        return key in self._done
+
+    def resume(self, key):
+        """
+        :param key: Collection unit.
+        :return: None if the unit was never started or is done, otherwise a tuple of the next page token (None once the last page
+            was read) and every item recorded so far.
+        """
+        if key not in self._tokens:
+            return None
+        return self._tokens[key], list(self._items.get(key, []))
+
+    def record_page(self, key, next_token, items):
+        """
+        :param key: Collection unit.
+        :param next_token: Token or page number to request next, or None if this was the last page.
+        :param items: JSON-serializable results read from this page.
+        """
+        self._append({"key": key, "token": next_token, "items": list(items)})
+
+    def mark_done(self, key):
+        """Mark a unit as complete once its results are saved. Its journaled results are discarded and completed units
+        are skipped on resume."""
+        self._append({"key": key, "done": True})
+
+    @property
+    def completed(self):
+        return set(self._done)
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,209 @@
+import json
+import os
+import struct
+import sys
+from array import array
+from itertools import islice
+
+
+# Columns stored for every comment. Only text is required, the rest may be None
+COLUMNS = ("id", "text", "source", "timestamp", "stage")
+
+CORPUS_EXTENSION = ".tmc"
+
+_MAGIC = b"TMCORPUS1\n"
+_HEADER = struct.Struct("<I")
+
+
+def is_corpus(filename) -> bool:
+    """
+    :param filename: File to check.
+    :return: True if the file is in the columnar corpus format rather than CSV.
+    """
+    try:
+        with open(filename, "rb") as f:
+            return f.read(len(_MAGIC)) == _MAGIC
+    except (IsADirectoryError, FileNotFoundError):
+        return False
+
+
+def _offsets_bytes(offsets: array) -> bytes:
+    if sys.byteorder != "little":
+        offsets = array("q", offsets)
+        offsets.byteswap()
+    return offsets.tobytes()
+
+
+def _encode_column(values):
+    """Encode strings as code point offsets followed by one UTF-8 blob."""
+    offsets = array("q", [0])
+    position = 0
+    for value in values:
+        position += len(value)
+        offsets.append(position)
+    return _offsets_bytes(offsets), "".join(values).encode("utf-8", "surrogatepass")
+
+
+class CorpusWriter:
+    """Write comments to a columnar corpus file.
+
+    Rows are buffered and written in row groups of ``row_group_size`` rows.
+    Within a group each column is stored as an array of offsets plus one UTF-8
+    blob, so a reader decodes a whole column with one call instead of parsing
+    rows one by one. Missing values are stored as empty strings and read back
+    as None, except for text. Opening with ``append=True`` adds row groups to
+    an existing file.
+    """
+
+    def __init__(self, filename, append: bool=False, row_group_size: int=65536):
+        """
+        :param filename: Corpus file to write.
+        :param append: Add to an existing corpus file instead of replacing it.
+        :param row_group_size: Rows buffered before a row group is written.
+        """
+        self.filename = filename
+        self.row_group_size = row_group_size
+        self._rows = 0
+        self._columns = {name: [] for name in COLUMNS}
+
+        if append and os.path.exists(filename) and os.path.getsize(filename) > 0:
+            if not is_corpus(filename):
+                raise ValueError(f"{filename} is not a corpus file.")
+            self._file = open(filename, "ab")
+        else:
+            self._file = open(filename, "wb")
+            self._file.write(_MAGIC)
+
+    def write(self, text: str, id=None, source=None, timestamp=None, stage=None):
+        """
+        :param text: Comment text.
+        :param id: Comment ID.
+        :param source: Video, outlet or file the comment came from.
+        :param timestamp: ISO 8601 time the comment was published.
+        :param stage: Letter code of the cleaning stages applied to the text.
+        """
+        columns = self._columns
+        columns["id"].append("" if id is None else str(id))
+        columns["text"].append(text)
+        columns["source"].append("" if source is None else str(source))
+        columns["timestamp"].append("" if timestamp is None else str(timestamp))
+        columns["stage"].append("" if stage is None else str(stage))
+        self._rows += 1
+        if self._rows >= self.row_group_size:
+            self.flush()
+
+    def write_records(self, records):
+        """
+        :param records: Iterable of dicts with a "text" key and optionally the other COLUMNS.
+        """
+        for record in records:
+            self.write(record["text"], record.get("id"), record.get("source"), record.get("timestamp"),
+                       record.get("stage"))
+
+    def write_texts(self, texts, **metadata):
+        """
+        :param texts: Iterable of comment texts.
+        :param metadata: Values of the other COLUMNS shared by every text.
+        """
+        for text in texts:
+            self.write(text, **metadata)
+
+    def flush(self):
+        """Write the buffered rows as one row group."""
+        if self._rows == 0:
+            return
+        encoded = [(name, _encode_column(self._columns[name])) for name in COLUMNS]
+        header = json.dumps({"rows": self._rows,
+                             "columns": [[name, len(blob)] for name, (_, blob) in encoded]}).encode("utf-8")
+        self._file.write(_HEADER.pack(len(header)))
+        self._file.write(header)
+        for _, (offsets, blob) in encoded:
+            self._file.write(offsets)
+            self._file.write(blob)
+        self._rows = 0
+        self._columns = {name: [] for name in COLUMNS}
+
+    def close(self):
+        self.flush()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def iter_row_groups(filename, columns=COLUMNS):
+    """
+    :param filename: Corpus file.
+    :param columns: Columns to decode. Other columns are skipped without decoding.
+    :return: Generator of dicts mapping each requested column to its list of values for one row group.
+    """
+    columns = set(columns)
+    with open(filename, "rb") as f:
+        if f.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{filename} is not a corpus file.")
+        while True:
+            prefix = f.read(_HEADER.size)
+            if len(prefix) < _HEADER.size:
+                return
+            header = json.loads(f.read(_HEADER.unpack(prefix)[0]))
+            rows = header["rows"]
+            group = {}
+            for name, blob_size in header["columns"]:
+                offsets_size = 8 * (rows + 1)
+                if name not in columns:
+                    f.seek(offsets_size + blob_size, os.SEEK_CUR)
+                    continue
+                offsets = array("q")
+                offsets.frombytes(f.read(offsets_size))
+                if sys.byteorder != "little":
+                    offsets.byteswap()
+                blob = f.read(blob_size).decode("utf-8", "surrogatepass")
+                values = [blob[start:end] for start, end in zip(offsets, islice(offsets, 1, None))]
+                if name != "text":
+                    values = [value or None for value in values]
+                group[name] = values
+            yield group
+
+
+def read_corpus(filename, columns=COLUMNS) -> dict:
+    """
+    :param filename: Corpus file.
+    :param columns: Columns to load.
+    :return: Dict mapping each column to the list of all its values.
+    """
+    data = {name: [] for name in columns}
+    for group in iter_row_groups(filename, columns):
+        for name in columns:
+            data[name].extend(group[name])
+    return data
+
+
+def iter_texts(filename):
+    """
+    :param filename: Corpus file.
+    :return: Generator of comment texts. Only the text column is decoded.
+    """
+    for group in iter_row_groups(filename, ("text",)):
+        yield from group["text"]
+
+
+def iter_records(filename):
+    """
+    :param filename: Corpus file.
+    :return: Generator of one dict per comment, keyed by COLUMNS.
+    """
+    for group in iter_row_groups(filename):
+        yield from (dict(zip(COLUMNS, row)) for row in zip(*(group[name] for name in COLUMNS)))
+
+
+def write_corpus(filename, records, append: bool=False):
+    """
+    :param filename: Corpus file.
+    :param records: Iterable of dicts with a "text" key and optionally the other COLUMNS.
+    :param append: Add to an existing corpus file.
+    """
+    with CorpusWriter(filename, append) as writer:
+        writer.write_records(records)
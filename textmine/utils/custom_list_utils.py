@@ -1,4 +1,7 @@
 import csv
+from itertools import islice
+
+from textmine.utils import corpus_store
 
 def single_to_multi(list_in: list):
     return [[item] for item in list_in]
@@ -18,4 +21,43 @@ def read(filename, delimiter=","):
         for row in reader:
             data.append(row)
 
-    return data
\ No newline at end of file
+    return data
+
+def iter_read(filename, delimiter=","):
+    with open(filename, "r") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        for row in reader:
+            yield row
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def iter_comments(filename):
+    """Yield every comment in a one-comment-per-cell CSV file or a columnar corpus file."""
+    if corpus_store.is_corpus(filename):
+        yield from corpus_store.iter_texts(filename)
+    else:
+        for row in iter_read(filename):
+            yield from row
+
+def iter_comment_records(filename):
+    """Like iter_comments, but yield dicts keyed by corpus_store.COLUMNS. Metadata is None for CSV files."""
+    if corpus_store.is_corpus(filename):
+        yield from corpus_store.iter_records(filename)
+    else:
+        for comment in iter_comments(filename):
+            yield {"id": None, "text": comment, "source": None, "timestamp": None, "stage": None}
+
+def write_comments(comments, filename):
+    """Write comments as a columnar corpus file if filename ends in corpus_store.CORPUS_EXTENSION, otherwise as one
+    comment per CSV row."""
+    if filename.endswith(corpus_store.CORPUS_EXTENSION):
+        with corpus_store.CorpusWriter(filename) as writer:
+            writer.write_texts(comments)
+    else:
+        write(single_to_multi(comments), filename)
@@ -0,0 +1,70 @@
+import hashlib
+import os
+
+
+def text_hash(text: str) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class CommentDedup:
+    """Order-preserving, incremental de-duplication of comments.
+
+    A comment is a duplicate if its ID or the hash of its text has been seen
+    before, so each check costs two set lookups. Unique comments are kept in
+    the order they were added. The seen IDs and hashes can be persisted, so a
+    later run only accepts comments that are new since the last save.
+    """
+
+    def __init__(self, state_path: str=None):
+        """
+        :param state_path: File holding the IDs and text hashes seen by earlier runs. Loaded if it exists and
+            written by save(). None keeps everything in memory.
+        """
+        self._state_path = state_path
+        self._seen_ids = set()
+        self._seen_hashes = set()
+        self._new_keys = []
+        self._comments = []
+
+        if state_path is not None and os.path.exists(state_path):
+            with open(state_path, "r") as f:
+                for line in f:
+                    comment_id, _, hash_ = line.rstrip("\n").partition("\t")
+                    if comment_id:
+                        self._seen_ids.add(comment_id)
+                    if hash_:
+                        self._seen_hashes.add(hash_)
+
+    def add(self, comment_id, text: str) -> bool:
+        """
+        :param comment_id: API ID of the comment, or None if unknown.
+        :param text: Comment text.
+        :return: True if the comment was new and kept.
+        """
+        hash_ = text_hash(text)
+        if hash_ in self._seen_hashes or (comment_id is not None and comment_id in self._seen_ids):
+            return False
+
+        self._seen_hashes.add(hash_)
+        if comment_id is not None:
+            self._seen_ids.add(comment_id)
+        self._new_keys.append((comment_id or "", hash_))
+        self._comments.append(text)
+        return True
+
+    def __len__(self):
+        return len(self._comments)
+
+    @property
+    def comments(self):
+        """New unique comments, in the order they were added."""
+        return self._comments
+
+    def save(self):
+        """Append the keys of comments added since the last save to the state file."""
+        if self._state_path is None or not self._new_keys:
+            return
+        with open(self._state_path, "a") as f:
+            for comment_id, hash_ in self._new_keys:
+                f.write(f"{comment_id}\t{hash_}\n")
+        self._new_keys = []
@@ -1,64 +1,233 @@
-import csv
 from wordcloud import WordCloud
-from sklearn.feature_extraction.text import CountVectorizer
-import pandas as pd
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
 import argparse
 import os
 
-def create_word_cloud(filename, directory_passed=False):
+import textmine.visualize.frequencies as frequencies_util
+from textmine.visualize.frequency_table import FrequencyTableStore
 
-    file_list = []
+# Image formats render_word_clouds can write
+RENDER_FORMATS = ("png", "svg")
+
+
+def _list_files(filename, directory_passed):
     if directory_passed:
-        for file in os.listdir(filename):
-            file_list.append(os.path.join(filename, file))
-    else:
-        file_list.append(filename)
+        return [os.path.join(filename, file) for file in os.listdir(filename)]
+    return [filename]
 
-    for file in file_list:
-        comments = []
-        with open(file, "r") as f:
-            reader = csv.reader(f, delimiter=",")
-            for row in reader:
-                comments.append(row)
 
-        rem_words = ["just", "dont", "song", "im", "like", "having", "things", "going"]
+def _file_dates(files, date):
+    return {file: date for file in files} if date else None
 
-        comments = [comment for sublist in comments for comment in sublist]
-        red_comments = []
 
-        for comment in comments:
-            word_list = comment.split(" ")
-            word_list_ = [word for word in word_list if word not in rem_words]
-            red_comments.append(" ".join(word_list_))
+def create_word_cloud(filename, directory_passed=False, top_k=None, combine=False, table_dir=None, start_date=None,
+                      end_date=None, date=None, by_source=False):
+    """
+    :param filename: Comment CSV file, or a directory of them if directory_passed is True.
+    :param directory_passed: filename is a directory.
+    :param top_k: Count only the top k n-grams in fixed memory instead of every n-gram exactly. Ignored with table_dir.
+    :param combine: Draw one word cloud for all files instead of one per file.
+    :param table_dir: Directory of persisted frequency tables. Only new or changed files are recounted, and the rest
+        are read from their tables.
+    :param start_date: With table_dir, only count comments dated on or after this ISO date. Undated comments are left
+        out.
+    :param end_date: With table_dir, only count comments dated on or before this ISO date. Undated comments are left
+        out.
+    :param date: With table_dir, ISO date of comments without a timestamp, i.e. every comment of a CSV file. Corpus
+        comments are dated by their timestamp column.
+    :param by_source: With table_dir, draw one word cloud per comment source, e.g. per video or outlet, summed over
+        all files, instead of one per file.
+    """
+    # Only the interactive path needs a display, so matplotlib is imported here
+    import matplotlib.pyplot as plt
 
-        count_v = CountVectorizer(input="content", stop_words="english", ngram_range=(2, 3))
+    file_list = _list_files(filename, directory_passed)
 
-        comment_arr = count_v.fit_transform(red_comments).toarray()
-        word_frame = pd.DataFrame(comment_arr, columns = count_v.get_feature_names_out())
-        summed_frame = word_frame.sum(axis=0, numeric_only=True)
+    if table_dir:
+        store = FrequencyTableStore(table_dir)
+        store.update(file_list, _file_dates(file_list, date))
+        if by_source:
+            groups = ((source or "Unknown source", table.counts)
+                      for source, table in store.source_tables(start_date, end_date, file_list).items())
+        elif combine:
+            groups = [(filename, store.combined(start_date, end_date, file_list).counts)]
+        else:
+            groups = ((table.source, table.counts) for table in store.tables(start_date, end_date, file_list))
+    elif combine:
+        frequencies = frequencies_util.ngram_counter(top_k)
+        for file in file_list:
+            frequencies_util.count_file_ngrams(file, counts=frequencies)
+        groups = [(filename, frequencies)]
+    else:
+        groups = ((file, frequencies_util.count_file_ngrams(file, counts=frequencies_util.ngram_counter(top_k)))
+                  for file in file_list)
 
-        wordcloud = WordCloud().generate_from_frequencies(summed_frame)
-        plt.title(file)
+    for title, frequencies in groups:
+        wordcloud = WordCloud().generate_from_frequencies(frequencies_util.word_cloud_frequencies(frequencies))
+        plt.title(title)
         plt.imshow(wordcloud)
         plt.show()
 
 
+# WordCloud built once per render process by _init_render_worker, so the font
+# and mask are loaded once and reused for every file
+_render_cloud = None
+
+
+def _init_render_worker(cloud_kwargs, mask_path):
+    global _render_cloud
+    if mask_path:
+        import numpy as np
+        from PIL import Image
+        cloud_kwargs = dict(cloud_kwargs, mask=np.array(Image.open(mask_path)))
+    _render_cloud = WordCloud(**cloud_kwargs)
+
+
+def _render_file(file, output_path, image_format, top_k, table_dir, date):
+    if table_dir:
+        store = FrequencyTableStore(table_dir)
+        store.update([file], _file_dates([file], date))
+        frequencies = store.get(file).counts
+    else:
+        frequencies = frequencies_util.count_file_ngrams(file, counts=frequencies_util.ngram_counter(top_k))
+    frequencies = frequencies_util.word_cloud_frequencies(frequencies)
+    if not frequencies:
+        return None
+
+    _render_cloud.generate_from_frequencies(frequencies)
+    if image_format == "svg":
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(_render_cloud.to_svg())
+    else:
+        _render_cloud.to_file(output_path)
+    return output_path
+
+
+def render_word_clouds(filename,
+                       save_dir="./",
+                       directory_passed=False,
+                       image_format="png",
+                       workers=1,
+                       top_k=None,
+                       font_path=None,
+                       mask_path=None,
+                       width=400,
+                       height=200,
+                       background_color="black",
+                       table_dir=None,
+                       date=None):
+    """Write one word cloud image per comment file without a display.
+
+    Counting and layout for each file run on a pool of ``workers`` processes.
+    Each process builds its WordCloud, font and mask once. Images are named
+    after their input file, e.g. ``comments.csv`` becomes ``comments.png``.
+    Files without any n-grams are skipped.
+
+    :param filename: Comment CSV file, or a directory of them if directory_passed is True.
+    :param save_dir: Directory the images are written to.
+    :param directory_passed: filename is a directory.
+    :param image_format: "png" or "svg".
+    :param workers: Number of processes.
+    :param top_k: Count only the top k n-grams in fixed memory instead of every n-gram exactly.
+    :param font_path: TrueType font for the words. Defaults to the WordCloud font.
+    :param mask_path: Image whose white areas are left empty. The image size overrides width and height.
+    :param width: Image width in pixels.
+    :param height: Image height in pixels.
+    :param background_color: Background color name.
+    :param table_dir: Directory of persisted frequency tables. Only new or changed files are recounted.
+    :param date: With table_dir, ISO date of comments without a timestamp.
+    :return: List of the image paths written.
+    """
+    if image_format not in RENDER_FORMATS:
+        raise ValueError(f"Unsupported image format '{image_format}'. Expected one of {RENDER_FORMATS}.")
+
+    os.makedirs(save_dir, exist_ok=True)
+    jobs = [(file, os.path.join(save_dir, os.path.splitext(os.path.basename(file))[0] + "." + image_format))
+            for file in _list_files(filename, directory_passed)]
+    cloud_kwargs = {"font_path": font_path, "width": width, "height": height, "background_color": background_color}
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_render_worker,
+                                 initargs=(cloud_kwargs, mask_path)) as executor:
+            futures = [(file, executor.submit(_render_file, file, output_path, image_format, top_k, table_dir,
+                                                   date))
+                       for file, output_path in jobs]
+            results = [(file, future.result()) for file, future in futures]
+    else:
+        _init_render_worker(cloud_kwargs, mask_path)
+        results = [(file, _render_file(file, output_path, image_format, top_k, table_dir, date))
+                   for file, output_path in jobs]
+
+    written = []
+    for file, output_path in results:
+        if output_path is None:
+            print(f"Skipping {file}: no n-grams to draw.")
+        else:
+            written.append(output_path)
+    return written
+
+
 if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser()
     parser.add_argument('-f','--filename')
     parser.add_argument('-d', '--dirname')
+    parser.add_argument('-k', '--top_k', type=int,
+                        help="Keep only the top k n-grams in fixed memory instead of counting every n-gram.")
+    parser.add_argument('-c', '--combine', action="store_true",
+                        help="Draw one word cloud for every file in --dirname.")
+    parser.add_argument('-t', '--table_dir',
+                        help="Directory of persisted frequency tables. Only new or changed comment files are "
+                             "recounted.")
+    parser.add_argument('--by_source', action="store_true",
+                        help="With --table_dir, draw one word cloud per video or outlet in the corpus source column "
+                             "instead of one per file.")
+    parser.add_argument('--date',
+                        help="With --table_dir, date (YYYY-MM-DD) of comments without a timestamp, i.e. every "
+                             "comment of a CSV file. Corpus comments are dated by their timestamp.")
+    parser.add_argument('--start_date',
+                        help="With --table_dir, only count comments dated on or after this date (YYYY-MM-DD). "
+                             "Undated comments are left out.")
+    parser.add_argument('--end_date',
+                        help="With --table_dir, only count comments dated on or before this date (YYYY-MM-DD). "
+                             "Undated comments are left out.")
+    parser.add_argument('-o', '--output_dir',
+                        help="Write the word clouds as image files to this directory instead of showing them. No "
+                             "display is needed.")
+    parser.add_argument('--format', default="png", choices=RENDER_FORMATS,
+                        help="Image format used with --output_dir. Defaults to png.")
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help="Number of processes used with --output_dir. Defaults to 1.")
+    parser.add_argument('--font_path',
+                        help="TrueType font used with --output_dir.")
+    parser.add_argument('--mask',
+                        help="Mask image used with --output_dir.")
 
     args = parser.parse_args()
     if args.filename and args.dirname:
         args.dirname = None
         print("Both directory and filename passed. Defaulting to file only.")
 
-    if args.filename:
-        create_word_cloud(args.filename)
+    if args.output_dir and (args.filename or args.dirname):
+        if args.combine:
+            print("--combine is not supported with --output_dir. Rendering one image per file.")
+        written = render_word_clouds(args.filename or args.dirname,
+                                     args.output_dir,
+                                     args.filename is None,
+                                     args.format,
+                                     args.workers,
+                                     args.top_k,
+                                     args.font_path,
+                                     args.mask,
+                                     table_dir=args.table_dir,
+                                     date=args.date)
+        print(f"Wrote {len(written)} word clouds to {args.output_dir}")
+    elif args.filename:
+        create_word_cloud(args.filename, top_k=args.top_k, table_dir=args.table_dir, start_date=args.start_date,
+                          end_date=args.end_date, date=args.date, by_source=args.by_source)
     elif args.dirname:
-        create_word_cloud(args.dirname, True)
+        create_word_cloud(args.dirname, True, args.top_k, args.combine, args.table_dir, args.start_date,
+                          args.end_date, args.date, args.by_source)
     else:
         print("Nothing passed. Exiting.")
@@ -0,0 +1,103 @@
+from collections import Counter
+
+from sklearn.feature_extraction.text import CountVectorizer
+
+import textmine.utils.custom_list_utils as list_utils
+from textmine.visualize.heavy_hitters import CountMinSketch, HeavyHitters
+
+
+# Words dropped from comments before counting n-grams for word clouds
+REMOVED_WORDS = ("just", "dont", "song", "im", "like", "having", "things", "going")
+
+
+def ngram_analyzer(ngram_range=(2, 3), stop_words="english"):
+    """
+    :param ngram_range: Smallest and largest n-gram size.
+    :param stop_words: Stop words passed to CountVectorizer.
+    :return: Function turning one comment into its n-grams, with the same preprocessing, tokenization and stop word
+        handling as CountVectorizer.
+    """
+    return CountVectorizer(input="content", stop_words=stop_words, ngram_range=ngram_range).build_analyzer()
+
+
+def ngram_counter(top_k=None, sketch_width=None, sketch_depth=4):
+    """
+    :param top_k: Keep only the top k n-grams in fixed memory. None counts every n-gram exactly.
+    :param sketch_width: Width of a CountMinSketch that tightens the top_k estimates. None for no sketch.
+    :param sketch_depth: Depth of that sketch.
+    :return: A Counter, or a HeavyHitters counter if top_k is given. Either can be passed to count_ngrams().
+    """
+    if top_k is None:
+        return Counter()
+    sketch = CountMinSketch(sketch_width, sketch_depth) if sketch_width else None
+    return HeavyHitters(top_k, sketch)
+
+
+def iter_file_comments(filename):
+    yield from list_utils.iter_comments(filename)
+
+
+def count_ngrams(comments, ngram_range=(2, 3), stop_words="english", removed_words=REMOVED_WORDS, counts=None):
+    """Stream comments into n-gram counts without building a document-term matrix.
+
+    The counts are identical to summing the columns of
+    ``CountVectorizer(...).fit_transform(comments)``, but memory grows only with
+    the number of distinct n-grams.
+
+    :param comments: Iterable of comments. Consumed lazily.
+    :param ngram_range: Smallest and largest n-gram size.
+    :param stop_words: Stop words passed to CountVectorizer.
+    :param removed_words: Words removed from each comment before analysis.
+    :param counts: Counter or HeavyHitters to add to. A new Counter is created if None.
+    :return: The counter of n-gram frequencies.
+    """
+    analyze = ngram_analyzer(ngram_range, stop_words)
+    removed_words = frozenset(removed_words or ())
+    counts = Counter() if counts is None else counts
+
+    for comment in comments:
+        if removed_words:
+            comment = " ".join(word for word in comment.split(" ") if word not in removed_words)
+        counts.update(analyze(comment))
+    return counts
+
+
+def count_grouped_ngrams(pairs, ngram_range=(2, 3), stop_words="english", removed_words=REMOVED_WORDS):
+    """Like count_ngrams(), but count each comment into the counter of its group, e.g. its day.
+
+    :param pairs: Iterable of (group, comment) tuples. Consumed lazily.
+    :param ngram_range: Smallest and largest n-gram size.
+    :param stop_words: Stop words passed to CountVectorizer.
+    :param removed_words: Words removed from each comment before analysis.
+    :return: Dict mapping each group to a Counter of its n-gram frequencies.
+    """
+    analyze = ngram_analyzer(ngram_range, stop_words)
+    removed_words = frozenset(removed_words or ())
+    groups = {}
+
+    for group, comment in pairs:
+        if removed_words:
+            comment = " ".join(word for word in comment.split(" ") if word not in removed_words)
+        counts = groups.get(group)
+        if counts is None:
+            counts = groups[group] = Counter()
+        counts.update(analyze(comment))
+    return groups
+
+
+def count_file_ngrams(filename, **kwargs):
+    """
+    :param filename: Comment CSV or corpus file.
+    :param kwargs: Passed to count_ngrams().
+    :return: The counter of n-gram frequencies.
+    """
+    return count_ngrams(iter_file_comments(filename), **kwargs)
+
+
+def word_cloud_frequencies(counts):
+    """
+    :param counts: Mapping of n-gram to frequency, or a HeavyHitters counter.
+    :return: Dict ordered by n-gram, the order CountVectorizer features have. WordCloud breaks frequency ties by input
+        order, so this gives the same layout as the old dense matrix sum.
+    """
+    return dict(sorted(counts.items()))
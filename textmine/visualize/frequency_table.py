@@ -0,0 +1,343 @@
+import gzip
+import hashlib
+import json
+import os
+import warnings
+from collections import Counter
+
+import textmine.utils.custom_list_utils as list_utils
+import textmine.visualize.frequencies as frequencies_util
+
+
+# Version of the table layout. Tables saved with another version are recounted
+TABLE_VERSION = 3
+
+
+def _in_window(date, start_date, end_date):
+    if date is None:
+        return start_date is None and end_date is None
+    return (start_date is None or date >= start_date) and (end_date is None or date <= end_date)
+
+
+def _may_overlap(header, start_date, end_date, sources):
+    """False only if a table's sidecar shows that none of its comments fall inside the window."""
+    if header is None or header.get("version") != TABLE_VERSION:
+        return True
+    if sources is not None and not sources.intersection(header["sources"]):
+        return False
+    if start_date is None and end_date is None:
+        return True
+    if header["last_date"] is None:
+        return False
+    return ((start_date is None or header["last_date"] >= start_date)
+            and (end_date is None or header["first_date"] <= end_date))
+
+
+def _bucket(record, date):
+    return record["source"], record["timestamp"][:10] if record["timestamp"] else date
+
+
+class FrequencyTable:
+    """Persisted n-gram counts for one comment file, video or outlet.
+
+    Counts are kept in buckets keyed by the comments' source (the corpus
+    ``source`` column, e.g. a video ID or outlet) and day (the ``timestamp``
+    column), so a table can be windowed by date and source with
+    :meth:`window`, or split into one table per video or outlet with
+    :meth:`by_source`. Comments without a timestamp, such as every comment of
+    a CSV file, are filed under the table's fallback ``date``. If it has none
+    they are left out of every date window. Tables are exact, so any number
+    of them can be summed with ``+`` or :meth:`merge` and passed to
+    ``WordCloud.generate_from_frequencies`` without re-reading the raw text.
+    """
+
+    def __init__(self, counts=None, source: str=None, date: str=None, ngram_range=(2, 3), metadata: dict=None,
+                 buckets: dict=None):
+        """
+        :param counts: Mapping of n-gram to count, for comments filed under date with no comment source.
+        :param source: Name of what was counted, e.g. a file path, video ID or outlet.
+        :param date: Fallback ISO date (YYYY-MM-DD) of comments without a timestamp.
+        :param ngram_range: n-gram sizes counted. Only tables with the same range can be merged.
+        :param metadata: Extra JSON-serializable information stored with the table.
+        :param buckets: Mapping of (comment source, ISO date) to a mapping of n-gram to count. Either may be None.
+        """
+        self.source = source
+        self.date = date
+        self.ngram_range = tuple(ngram_range)
+        self.metadata = dict(metadata or {})
+        self.buckets = {}
+        self.counts = Counter()
+        for bucket, bucket_counts in (buckets or {}).items():
+            self._add(bucket, bucket_counts)
+        if counts:
+            self._add((None, date), counts)
+
+    def _add(self, bucket, counts):
+        bucket_counts = self.buckets.get(bucket)
+        if bucket_counts is None:
+            bucket_counts = self.buckets[bucket] = Counter()
+        bucket_counts.update(counts)
+        self.counts.update(counts)
+
+    @classmethod
+    def from_file(cls, filename: str, date: str=None, ngram_range=(2, 3), **kwargs) -> 'FrequencyTable':
+        """
+        :param filename: Comment CSV or corpus file.
+        :param date: Fallback ISO date of comments without a timestamp. CSV files have no timestamps, so all their
+            comments are filed under it.
+        :param ngram_range: n-gram sizes to count.
+        :param kwargs: Passed to frequencies.count_grouped_ngrams().
+        :return: Table of the file's exact n-gram counts per comment source and day.
+        """
+        stat = os.stat(filename)
+        pairs = ((_bucket(record, date), record["text"]) for record in list_utils.iter_comment_records(filename))
+        buckets = frequencies_util.count_grouped_ngrams(pairs, ngram_range=ngram_range, **kwargs)
+        return cls(None, filename, date, ngram_range, {"mtime": stat.st_mtime, "size": stat.st_size}, buckets)
+
+    def merge(self, other: 'FrequencyTable'):
+        """Add another table's counts to this one."""
+        if other.ngram_range != self.ngram_range:
+            raise ValueError(f"Cannot merge tables with n-gram ranges {self.ngram_range} and {other.ngram_range}.")
+        for bucket, bucket_counts in other.buckets.items():
+            self._add(bucket, bucket_counts)
+        if other.date and (self.date is None or other.date > self.date):
+            self.date = other.date
+
+    def __add__(self, other: 'FrequencyTable') -> 'FrequencyTable':
+        combined = FrequencyTable(None, None, self.date, self.ngram_range, buckets=self.buckets)
+        combined.merge(other)
+        return combined
+
+    def window(self, start_date: str=None, end_date: str=None, sources=None) -> 'FrequencyTable':
+        """
+        :param start_date: Earliest ISO date to include.
+        :param end_date: Latest ISO date to include.
+        :param sources: Only include comments from these comment sources, e.g. video IDs or outlets.
+        :return: Table of the comments inside the window. Undated comments are only included without a date window.
+        """
+        if start_date is None and end_date is None and sources is None:
+            return self
+        sources = None if sources is None else set(sources)
+        buckets = {(source, day): bucket_counts for (source, day), bucket_counts in self.buckets.items()
+                   if _in_window(day, start_date, end_date) and (sources is None or source in sources)}
+        return FrequencyTable(None, self.source, self.date, self.ngram_range, self.metadata, buckets)
+
+    def by_source(self) -> dict:
+        """
+        :return: Dict mapping each comment source, e.g. a video ID or outlet, to a table of its comments. Comments
+            without a source are under None.
+        """
+        tables = {}
+        for (source, day), bucket_counts in self.buckets.items():
+            table = tables.get(source)
+            if table is None:
+                table = tables[source] = FrequencyTable(None, source, self.date, self.ngram_range)
+            table._add((source, day), bucket_counts)
+        return tables
+
+    @property
+    def sources(self):
+        """Comment sources with comments in the table, e.g. video IDs or outlets."""
+        return sorted({source for source, _ in self.buckets if source is not None})
+
+    @property
+    def first_date(self):
+        """Earliest day with comments, or None if no comment is dated."""
+        return min((day for _, day in self.buckets if day is not None), default=None)
+
+    @property
+    def last_date(self):
+        """Latest day with comments, or None if no comment is dated."""
+        return max((day for _, day in self.buckets if day is not None), default=None)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def most_common(self, n: int=None):
+        return self.counts.most_common(n)
+
+    def frequencies(self) -> dict:
+        """
+        :return: Counts in the order create_word_cloud passes them to ``WordCloud.generate_from_frequencies``.
+        """
+        return frequencies_util.word_cloud_frequencies(self.counts)
+
+    def header(self) -> dict:
+        """
+        :return: Everything about the table except its counts.
+        """
+        return {"version": TABLE_VERSION,
+                "source": self.source,
+                "date": self.date,
+                "first_date": self.first_date,
+                "last_date": self.last_date,
+                "sources": self.sources,
+                "ngram_range": list(self.ngram_range),
+                "metadata": self.metadata}
+
+    def save(self, path: str):
+        """Write the table as gzipped JSON. The file is replaced atomically."""
+        data = dict(self.header(), buckets=[[source, day, bucket_counts]
+                                            for (source, day), bucket_counts in self.buckets.items()])
+        tmp_path = path + ".tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'FrequencyTable':
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if "buckets" in data:
+            buckets = {(source, day): bucket_counts for source, day, bucket_counts in data["buckets"]}
+        else:
+            # Tables saved before counts were kept per comment source and day
+            buckets = {(None, data["date"]): data["counts"]}
+        return cls(None, data["source"], data["date"], data["ngram_range"], data["metadata"], buckets)
+
+
+class FrequencyTableStore:
+    """Directory of per-file FrequencyTables that is updated incrementally.
+
+    Tables are stored per file. Per-video and per-outlet tables are built from
+    the comment sources inside them, see :meth:`source_tables`, so a video or
+    outlet spread over several files is summed across them.
+
+    :meth:`update` only recounts files that are new or whose size or
+    modification time changed since their table was saved. Adding one comment
+    file therefore costs a pass over that file alone, and combined counts are
+    summed from the stored tables. Each table has a small JSON sidecar holding
+    its header, date range and comment sources, so checking for changes and
+    skipping tables outside a window never decompress a table.
+    """
+
+    def __init__(self, directory: str, ngram_range=(2, 3)):
+        """
+        :param directory: Directory holding the tables. Created if missing.
+        :param ngram_range: n-gram sizes counted. Tables counted with another range are recounted.
+        """
+        self.directory = directory
+        self.ngram_range = tuple(ngram_range)
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, source: str) -> str:
+        name = os.path.splitext(os.path.basename(source))[0]
+        digest = hashlib.sha1(os.path.abspath(source).encode("utf-8")).hexdigest()[:12]
+        return os.path.join(self.directory, f"{name}-{digest}.json.gz")
+
+    @staticmethod
+    def _header_path(path: str) -> str:
+        return path[:-len(".json.gz")] + ".meta.json"
+
+    def _header(self, path: str):
+        try:
+            with open(self._header_path(path), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _save(self, table: FrequencyTable, path: str):
+        # Table first, so a sidecar always describes the table next to it
+        table.save(path)
+        header_path = self._header_path(path)
+        with open(header_path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(table.header(), f, ensure_ascii=False)
+        os.replace(header_path + ".tmp", header_path)
+
+    def get(self, source: str):
+        """
+        :param source: Comment file the table was counted from.
+        :return: The stored table, or None.
+        """
+        path = self._path(source)
+        if not os.path.exists(path):
+            return None
+        return FrequencyTable.load(path)
+
+    def update(self, files, dates: dict=None):
+        """Count the files that changed since their tables were saved.
+
+        :param files: Comment CSV or corpus files.
+        :param dates: Optional mapping of file to the fallback ISO date of its comments without a timestamp, see
+            FrequencyTable.from_file().
+        :return: List of the files that were recounted.
+        """
+        dates = dates or {}
+        recounted = []
+        for file in files:
+            stat = os.stat(file)
+            path = self._path(file)
+            header = self._header(path)
+            if (header is not None
+                    and header.get("version") == TABLE_VERSION
+                    and tuple(header["ngram_range"]) == self.ngram_range
+                    and header["metadata"].get("mtime") == stat.st_mtime
+                    and header["metadata"].get("size") == stat.st_size
+                    and (file not in dates or header["date"] == dates[file])
+                    and os.path.exists(path)):
+                continue
+            self._save(FrequencyTable.from_file(file, dates.get(file), self.ngram_range), path)
+            recounted.append(file)
+        return recounted
+
+    def tables(self, start_date: str=None, end_date: str=None, files=None, sources=None):
+        """
+        :param start_date: Earliest ISO date to include.
+        :param end_date: Latest ISO date to include.
+        :param files: Only include tables counted from these files.
+        :param sources: Only include comments from these comment sources, e.g. video IDs or outlets.
+        :return: Generator of the stored per-file tables, each windowed to the comments inside the window. Tables
+            without comments in the window are skipped, and only tables that may have some are decompressed. A warning
+            is issued if a date window leaves out tables because none of their comments are dated.
+        """
+        if files is not None:
+            paths = [self._path(file) for file in files]
+        else:
+            paths = [os.path.join(self.directory, name) for name in sorted(os.listdir(self.directory))
+                     if name.endswith(".json.gz")]
+        sources = None if sources is None else set(sources)
+        dated = start_date is not None or end_date is not None
+        windowed = dated or sources is not None
+
+        undated = 0
+        for path in paths:
+            if not os.path.exists(path):
+                continue
+            if windowed:
+                header = self._header(path)
+                if not _may_overlap(header, start_date, end_date, sources):
+                    in_sources = sources is None or sources.intersection(header["sources"])
+                    if dated and in_sources and header["last_date"] is None:
+                        undated += 1
+                    continue
+            table = FrequencyTable.load(path).window(start_date, end_date, sources)
+            if table.counts or not windowed:
+                yield table
+
+        if undated:
+            warnings.warn(f"{undated} frequency tables have no dated comments and were left out of the date window. "
+                          f"CSV comments have no timestamps, so give their files a date (--date or the dates argument "
+                          f"of update()) or collect comments as corpus files.")
+
+    def source_tables(self, start_date: str=None, end_date: str=None, files=None, sources=None) -> dict:
+        """
+        :return: Dict mapping each comment source, e.g. a video ID or outlet, to the sum of its comments in the window
+            over all stored files. Comments without a source are under None. See tables().
+        """
+        combined = {}
+        for table in self.tables(start_date, end_date, files, sources):
+            for source, source_table in table.by_source().items():
+                if source in combined:
+                    combined[source].merge(source_table)
+                else:
+                    combined[source] = source_table
+        return combined
+
+    def combined(self, start_date: str=None, end_date: str=None, files=None, sources=None) -> FrequencyTable:
+        """
+        :return: Sum of the stored tables' comments in the window. See tables().
+        """
+        combined = FrequencyTable(ngram_range=self.ngram_range)
+        for table in self.tables(start_date, end_date, files, sources):
+            combined.merge(table)
+        return combined
@@ -0,0 +1,214 @@
+import heapq
+import math
+import zlib
+from array import array
+
+
+def _hash_pair(item: str):
+    data = item.encode("utf-8")
+    # Two independent, process-stable hashes for double hashing. Python's
+    # hash() is salted per process, which would make sketches unmergeable
+    return zlib.crc32(data), zlib.adler32(data) | 1
+
+
+class CountMinSketch:
+    """Fixed-size frequency sketch using feature hashing.
+
+    Each item is hashed into one counter per row and its estimate is the
+    smallest of those counters. Estimates never undercount. With
+    ``width = ceil(e / epsilon)`` and ``depth = ceil(ln(1 / delta))``, an
+    estimate exceeds the true count by more than ``epsilon * total`` with
+    probability at most ``delta``.
+    """
+
+    def __init__(self, width: int=1 << 18, depth: int=4):
+        """
+        :param width: Counters per row.
+        :param depth: Number of rows, i.e. hash functions.
+        """
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._table = array("q", bytes(8 * width * depth))
+
+    @classmethod
+    def from_error(cls, epsilon: float=1e-5, delta: float=0.01) -> 'CountMinSketch':
+        """
+        :param epsilon: Overcount bound as a fraction of the total count.
+        :param delta: Probability that an estimate exceeds the bound.
+        :return: A sketch sized for the requested bounds.
+        """
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+    def _indexes(self, item):
+        h1, h2 = _hash_pair(item)
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, item: str, count: int=1) -> int:
+        """
+        :param item: Item to count.
+        :param count: Occurrences to add.
+        :return: The item's new estimate.
+        """
+        table = self._table
+        estimate = None
+        for index in self._indexes(item):
+            table[index] += count
+            if estimate is None or table[index] < estimate:
+                estimate = table[index]
+        self.total += count
+        return estimate
+
+    def estimate(self, item: str) -> int:
+        table = self._table
+        return min(table[index] for index in self._indexes(item))
+
+    @property
+    def error_bound(self) -> float:
+        """Overcount bound ``e / width * total`` that holds for each estimate with probability ``1 - e^-depth``."""
+        return math.e / self.width * self.total
+
+    def merge(self, other: 'CountMinSketch'):
+        """Add the counts of a sketch with the same dimensions."""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Only sketches with the same width and depth can be merged.")
+        table = self._table
+        for index, value in enumerate(other._table):
+            if value:
+                table[index] += value
+        self.total += other.total
+
+
+class HeavyHitters:
+    """Bounded-memory top-K frequency counter (Space-Saving).
+
+    Up to ``2 * k`` candidate items are tracked. When the table is full, the
+    ``k`` lowest counters are evicted, and the largest evicted count becomes
+    the floor that new items start from. Every tracked count is an upper bound
+    on the true count, and overcounts by at most the item's recorded error. An
+    item whose true count is above the floor is always tracked. If a
+    CountMinSketch is attached, estimates are the smaller of the two upper
+    bounds, which tightens the counts of items that entered at a high floor.
+
+    Memory is fixed by ``k`` and the sketch size, however many distinct items
+    are seen.
+    """
+
+    def __init__(self, k: int=1000, sketch: CountMinSketch=None):
+        """
+        :param k: Number of top items to report.
+        :param sketch: Optional CountMinSketch to tighten the estimates.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        self.k = k
+        self.sketch = sketch
+        self.total = 0
+        self._floor = 0
+        self._counts = {}
+        self._errors = {}
+
+    def add(self, item: str, count: int=1):
+        counts = self._counts
+        self.total += count
+        if self.sketch is not None:
+            self.sketch.add(item, count)
+
+        if item in counts:
+            counts[item] += count
+            return
+
+        if len(counts) >= 2 * self.k:
+            self._prune()
+        counts[item] = self._floor + count
+        if self._floor:
+            self._errors[item] = self._floor
+
+    def update(self, items):
+        """
+        :param items: Iterable of items, each counted once, or a mapping of item to count.
+        """
+        if hasattr(items, "items"):
+            for item, count in items.items():
+                self.add(item, count)
+        else:
+            for item in items:
+                self.add(item)
+
+    def _prune(self):
+        counts = self._counts
+        evicted = heapq.nsmallest(len(counts) - self.k, counts.items(), key=lambda pair: pair[1])
+        for item, count in evicted:
+            del counts[item]
+            self._errors.pop(item, None)
+        if evicted:
+            self._floor = max(self._floor, evicted[-1][1])
+
+    def estimate(self, item: str) -> int:
+        """
+        :param item: Item to look up.
+        :return: Upper bound on the item's count. Untracked items return the current floor, or the sketch estimate if
+            that is smaller.
+        """
+        count = self._counts.get(item, self._floor)
+        if self.sketch is not None:
+            count = min(count, self.sketch.estimate(item))
+        return count
+
+    def error(self, item: str) -> int:
+        """
+        :param item: Tracked item.
+        :return: Maximum overcount of the item's estimate.
+        """
+        error = self._errors.get(item, 0) if item in self._counts else self._floor
+        if self.sketch is not None:
+            error = min(error, math.ceil(self.sketch.error_bound))
+        return error
+
+    def most_common(self, n: int=None):
+        """
+        :param n: Number of items. Defaults to k.
+        :return: List of (item, estimate) tuples, highest first.
+        """
+        n = self.k if n is None else min(n, self.k)
+        estimates = ((item, self.estimate(item)) for item in self._counts)
+        return heapq.nlargest(n, estimates, key=lambda pair: pair[1])
+
+    def items(self):
+        """The top k (item, estimate) pairs, so the counter can be used like a frequency mapping."""
+        return self.most_common()
+
+    def merge(self, other: 'HeavyHitters'):
+        """Add another counter's counts. Merged estimates stay upper bounds.
+
+        The sketch is kept only if both counters have one.
+        """
+        counts, errors = self._counts, self._errors
+
+        # Items only tracked here may have up to other._floor untracked occurrences there, and vice versa
+        for item in counts:
+            if item not in other._counts and other._floor:
+                counts[item] += other._floor
+                errors[item] = errors.get(item, 0) + other._floor
+        for item, count in other._counts.items():
+            if item in counts:
+                counts[item] += count
+                error = errors.get(item, 0) + other._errors.get(item, 0)
+            else:
+                counts[item] = self._floor + count
+                error = self._floor + other._errors.get(item, 0)
+            if error:
+                errors[item] = error
+
+        self._floor += other._floor
+        self.total += other.total
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        else:
+            self.sketch = None
+        if len(counts) > 2 * self.k:
+            self._prune()
+
+    def __len__(self):
+        return len(self._counts)